@@ -5,6 +5,11 @@ from pathlib import Path
 from typing import Tuple
 from PySide6.QtCore import QStandardPaths
 
+try:
+    import orjson  # optional: faster config parsing straight from bytes
+except ImportError:
+    orjson = None
+
 APP_NAME = "stagepro"
 CONFIG_FILE_NAME = "stagepro_config.json"
 
@@ -107,6 +112,12 @@ def default_config() -> dict:
         }
     }
 
+def parse_config_bytes(raw: bytes) -> dict:
+    """Parse config JSON from raw file bytes (orjson when installed, else stdlib json)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 def merge_defaults(d: dict, u: dict) -> dict:
     out = dict(d)
     for k, v in (u or {}).items():
@@ -116,6 +127,26 @@ def merge_defaults(d: dict, u: dict) -> dict:
             out[k] = v
     return out
 
+def save_config(path: Path, cfg: dict) -> None:
+    """Write cfg as JSON so readers see either the old file or the complete new one.
+
+    The JSON is streamed into a sibling ``.tmp`` file, fsynced and renamed
+    over path, so a crash mid-save never leaves a truncated config behind.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(cfg, fh, indent=2)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 def load_or_create_config(base_dir: Path) -> Tuple[Path, dict]:
     local_path = base_dir / CONFIG_FILE_NAME
     user_path = get_user_config_dir() / CONFIG_FILE_NAME
@@ -123,7 +154,7 @@ def load_or_create_config(base_dir: Path) -> Tuple[Path, dict]:
     for p in (local_path, user_path):
         if p.exists():
             try:
-                cfg = json.loads(p.read_text(encoding="utf-8"))
+                cfg = parse_config_bytes(p.read_bytes())
                 return p, merge_defaults(default_config(), cfg)
             except Exception:
                 return p, default_config()
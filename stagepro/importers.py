@@ -47,6 +47,27 @@ def normalize_song_file(src: Path) -> ImportedSong:
     return import_user_file_to_chordpro(src)
 
 
+def normalize_song_bytes(data: bytes) -> ImportedSong:
+    """Normalize raw song file bytes into canonical ChordPro text.
+
+    Same result as :func:`normalize_song_file` for a file holding ``data``;
+    lets callers read the file themselves (e.g. ahead of time on another thread).
+    """
+    return chordpro_from_text(decode_song_bytes(data))
+
+
+def decode_song_bytes(data: bytes) -> str:
+    """Decode song file bytes the way ``Path.read_text`` would.
+
+    UTF-8 with a latin-1 fallback, and universal newlines.
+    """
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
 def looks_like_chordpro(text: str) -> bool:
     """Heuristic detection: directives or chord tokens."""
     for line in text.splitlines():
@@ -172,11 +193,12 @@ def import_user_file_to_chordpro(src: Path) -> ImportedSong:
       from directives (if present). If missing, title/artist will be empty strings.
     - Otherwise, we require the strict fallback header format.
     """
-    try:
-        text = src.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        text = src.read_text(encoding="latin-1")
+    # One read; decode_song_bytes does the latin-1 fallback in memory.
+    return normalize_song_bytes(src.read_bytes())
+
 
+def chordpro_from_text(text: str) -> ImportedSong:
+    """Return canonical ChordPro text + title/artist for already-decoded song text."""
     if looks_like_chordpro(text):
         ok, reason = validate_chordpro_basic(text)
         if not ok:
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import queue
+import re
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Optional
 import fnmatch
 
-from ..importers import ImportErrorWithHint, normalize_song_file
+from ..importers import ImportErrorWithHint, normalize_song_bytes, normalize_song_file
 
 SUPPORTED_EXTS = {".cho", ".chopro", ".pro", ".txt"}
+# Lower- and upper-case forms for a C-level str.endswith fast path.
+_SUPPORTED_SUFFIXES = tuple(sorted(SUPPORTED_EXTS)) + tuple(sorted(e.upper() for e in SUPPORTED_EXTS))
+MANIFEST_NAME = "publish_manifest.json"
+
+_PUBLISH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Only fan the mirror walk out over threads when there are enough top-level
+# directories to split between them.
+_PARALLEL_SCAN_MIN_DIRS = 4
+# How many files publish_full may have read ahead of normalization.
+_READ_AHEAD = 64
 
 
 @dataclass
@@ -17,6 +34,8 @@ class PublishResult:
     files_written: int = 0
     files_deleted: int = 0
     errors: List[str] = field(default_factory=list)
+    # Per-file manifest entries: rel posix path -> {mtime_ns, size, sha256}
+    files: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     @property
     def success(self) -> bool:
@@ -24,45 +43,217 @@ class PublishResult:
 
 
 def is_supported_song_path(path: Path) -> bool:
-    return path.suffix.lower() in SUPPORTED_EXTS
+    return _has_supported_ext(path.name)
+
+
+def _has_supported_ext(name: str) -> bool:
+    """Same answer as ``Path(name).suffix.lower() in SUPPORTED_EXTS``, without building the suffix."""
+    if name.endswith(_SUPPORTED_SUFFIXES):
+        # A bare ".pro" is a dotfile with no suffix.
+        return name not in _SUPPORTED_SUFFIXES
+    # Mixed-case suffixes (".Cho") miss the tuple.
+    i = name.rfind(".")
+    return i > 0 and name[i:].lower() in SUPPORTED_EXTS
+
 
+# "*.pro" / "**/*.pro" and "archive/*" style globs, which plain string
+# checks answer without going through the regex engine.
+_SUFFIX_GLOB_RE = re.compile(r"^(?:\*\*/)?\*(\.\w+)$")
+_PREFIX_GLOB_RE = re.compile(r"^([^*?\[]+/)\*$")
 
-def _matches_globs(rel_path: str, globs: list[str]) -> bool:
-    if not globs:
-        return True
 
+@lru_cache(maxsize=32)
+def _compile_glob_group(globs: tuple[str, ...]) -> Optional[Callable[[str], bool]]:
+    """Compile a list of glob patterns into a single match function.
+
+    Literal suffix and prefix patterns become ``str.endswith``/``startswith``
+    checks; everything else is joined into one regex alternation. Patterns
+    are normcased the same way ``fnmatch.fnmatch`` does, so callers must
+    normcase the path they match against. Returns None for an empty list.
+    """
+    suffixes: list[str] = []
+    prefixes: list[str] = []
+    parts: list[str] = []
     for pat in globs:
-        # Normal match
-        if fnmatch.fnmatch(rel_path, pat):
-            return True
+        m = _SUFFIX_GLOB_RE.match(pat)
+        if m:
+            # fnmatch's "*" also matches "/", so "*.pro" is a plain suffix test.
+            suffixes.append(os.path.normcase(m.group(1)))
+            continue
+        m = _PREFIX_GLOB_RE.match(pat)
+        if m:
+            prefixes.append(os.path.normcase(m.group(1)))
+            continue
+
+        parts.append(fnmatch.translate(os.path.normcase(pat)))
 
         # fnmatch does NOT treat ** specially; "**/*.ext" won't match "file.ext" at root.
-        # So if pattern starts with "**/", also try it without that prefix.
-        if pat.startswith("**/") and fnmatch.fnmatch(rel_path, pat[3:]):
+        # So if pattern starts with "**/", also try it without that prefix. Check the
+        # raw pattern: on Windows normcase turns "**/" into "**\\".
+        if pat.startswith("**/"):
+            parts.append(fnmatch.translate(os.path.normcase(pat[3:])))
+    if not (suffixes or prefixes or parts):
+        return None
+
+    suffix_tuple = tuple(suffixes)
+    prefix_tuple = tuple(prefixes)
+    regex_match = re.compile("|".join(f"(?:{p})" for p in parts)).match if parts else None
+
+    def _matches(rel: str) -> bool:
+        if suffix_tuple and rel.endswith(suffix_tuple):
             return True
+        if prefix_tuple and rel.startswith(prefix_tuple):
+            return True
+        return regex_match is not None and regex_match(rel) is not None
+
+    return _matches
+
+
+def _is_song_entry(entry: os.DirEntry) -> bool:
+    # Name check first: it needs no syscall and rejects most non-song entries.
+    # is_file() is then answered from readdir's d_type for regular files; only
+    # symlinks (which rglob follows to files too) cost a stat.
+    return _has_supported_ext(entry.name) and entry.is_file()
+
+
+def _walk_song_entries(root_str: str, start_dirs: list[str]) -> list[tuple[str, os.DirEntry]]:
+    """Return (relative posix path, entry) for supported song files below start_dirs.
+
+    Uses an explicit stack of ``os.scandir`` iterators so no Path objects are
+    built for directories or non-song files. Directory symlinks are not
+    followed (same as ``Path.rglob``); file symlinks are.
+    """
+    prefix_len = len(root_str) + 1
+    found: list[tuple[str, os.DirEntry]] = []
+    stack = list(start_dirs)
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif _is_song_entry(entry):
+                    found.append((entry.path[prefix_len:].replace(os.sep, "/"), entry))
+    return found
+
+
+def _collect_song_entries(root: Path) -> list[tuple[str, os.DirEntry]]:
+    """Collect song entries under root, walking top-level directories in parallel.
+
+    Small trees are walked serially; thread start-up isn't worth it there.
+    """
+    root_str = os.fspath(root)
+    if not os.path.isdir(root_str):
+        return []
+
+    found: list[tuple[str, os.DirEntry]] = []
+    top_dirs: list[str] = []
+    with os.scandir(root_str) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                top_dirs.append(entry.path)
+            elif _is_song_entry(entry):
+                found.append((entry.name, entry))
+
+    if len(top_dirs) <= _PARALLEL_SCAN_MIN_DIRS:
+        found.extend(_walk_song_entries(root_str, top_dirs))
+        return found
+
+    with ThreadPoolExecutor(max_workers=min(_PUBLISH_WORKERS, len(top_dirs))) as pool:
+        for chunk in pool.map(lambda d: _walk_song_entries(root_str, [d]), top_dirs):
+            found.extend(chunk)
+    return found
 
-    return False
 
 def scan_files(mirror_dir: Path, include_globs: list[str], exclude_globs: list[str]) -> list[Path]:
+    included = _compile_glob_group(tuple(include_globs))
+    excluded = _compile_glob_group(tuple(exclude_globs))
     files: list[Path] = []
-    for path in mirror_dir.rglob("*"):
-        if not path.is_file():
-            continue
-        if not is_supported_song_path(path):
+    for rel, entry in _collect_song_entries(mirror_dir):
+        rel = os.path.normcase(rel)
+        if excluded is not None and excluded(rel):
             continue
-        rel = path.relative_to(mirror_dir).as_posix()
-        if exclude_globs and _matches_globs(rel, exclude_globs):
+        if included is not None and not included(rel):
             continue
-        if include_globs and not _matches_globs(rel, include_globs):
-            continue
-        files.append(path)
+        files.append(Path(entry.path))
     return files
 
 
-def _write_normalized(src: Path, dest: Path) -> None:
-    imported = normalize_song_file(src)
+def _write_normalized(src: Path, dest: Path) -> tuple[bool, str]:
+    """Normalize src into dest.
+
+    Returns (written, sha256 hex digest of the output). When dest already holds
+    byte-identical output it is left untouched and written is False.
+    """
+    return _write_chordpro(normalize_song_file(src).chordpro_text, dest)
+
+
+def _write_chordpro(text: str, dest: Path) -> tuple[bool, str]:
+    data = text.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    try:
+        if dest.stat().st_size == len(data) and hashlib.sha256(dest.read_bytes()).hexdigest() == digest:
+            return False, digest
+    except FileNotFoundError:
+        pass
     dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_text(imported.chordpro_text, encoding="utf-8")
+    _atomic_write_bytes(dest, data)
+    return True, digest
+
+
+def _write_chordpro_fresh(text: str, dest: Path) -> str:
+    """Write text to a dest that does not exist yet; returns the sha256 hex digest.
+
+    For publish_full's scratch directory: nothing reads it until the final
+    directory swap, so there is no old file to compare against and no need for
+    a per-file fsync + rename.
+    """
+    data = text.encode("utf-8")
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_bytes(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def _atomic_write_bytes(dest: Path, data: bytes) -> None:
+    """Write data to dest so readers see either the old file or the complete new one.
+
+    The bytes go to a sibling ``.tmp`` file that is fsynced before being
+    renamed over dest, so a crash never leaves a truncated dest behind.
+    """
+    tmp = dest.with_name(dest.name + ".tmp")
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(tmp, flags, 0o644)
+    except FileExistsError:
+        # Left behind by an interrupted write.
+        os.unlink(tmp)
+        fd = os.open(tmp, flags, 0o644)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _read_with_stat(path: Path) -> tuple[os.stat_result, bytes]:
+    with open(path, "rb") as fh:
+        return os.fstat(fh.fileno()), fh.read()
+
+
+def _manifest_entry(st: os.stat_result, digest: str) -> Dict[str, Any]:
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+
+
+def _entry_matches(entry: Optional[Dict[str, Any]], st: os.stat_result) -> bool:
+    if not entry:
+        return False
+    return entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size
 
 
 def publish_full(source_id: str, mirror_dir: Path, published_dir: Path, files: Iterable[Path]) -> PublishResult:
@@ -72,16 +263,54 @@ def publish_full(source_id: str, mirror_dir: Path, published_dir: Path, files: I
         shutil.rmtree(tmp_dir)
     tmp_dir.mkdir(parents=True, exist_ok=True)
 
-    for path in files:
-        rel = path.relative_to(mirror_dir)
-        dest = tmp_dir / rel
-        try:
-            _write_normalized(path, dest)
+    files = list(files)
+    rels = [path.relative_to(mirror_dir) for path in files]
+    outcomes: list[Optional[tuple[str, Optional[Dict[str, Any]], Optional[str]]]] = [None] * len(files)
+    workers = max(1, min(_PUBLISH_WORKERS, len(files)))
+    # Reads run on their own thread into a bounded queue, so disk latency
+    # overlaps with normalization instead of stalling each worker in turn.
+    pending: queue.Queue = queue.Queue(maxsize=_READ_AHEAD)
+
+    def _read_all() -> None:
+        for idx, path in enumerate(files):
+            try:
+                pending.put((idx, path, *_read_with_stat(path), None))
+            except Exception as exc:
+                pending.put((idx, path, None, None, exc))
+        for _ in range(workers):
+            pending.put(None)
+
+    def _publish_loop() -> None:
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            idx, path, st, data, read_error = item
+            rel = rels[idx]
+            try:
+                if read_error is not None:
+                    raise read_error
+                imported = normalize_song_bytes(data)
+                digest = _write_chordpro_fresh(imported.chordpro_text, tmp_dir / rel)
+                outcomes[idx] = (rel.as_posix(), _manifest_entry(st, digest), None)
+            except ImportErrorWithHint as exc:
+                outcomes[idx] = (rel.as_posix(), None, str(exc))
+            except Exception as exc:
+                outcomes[idx] = (rel.as_posix(), None, str(exc))
+
+    reader = threading.Thread(target=_read_all, name="publish-read", daemon=True)
+    reader.start()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for fut in [pool.submit(_publish_loop) for _ in range(workers)]:
+            fut.result()
+    reader.join()
+
+    for rel_posix, entry, error in outcomes:
+        if error is None:
             result.files_written += 1
-        except ImportErrorWithHint as exc:
-            result.errors.append(f"{rel.as_posix()}: {exc}")
-        except Exception as exc:
-            result.errors.append(f"{rel.as_posix()}: {exc}")
+            result.files[rel_posix] = entry
+        else:
+            result.errors.append(f"{rel_posix}: {error}")
 
     if result.errors:
         return result
@@ -99,19 +328,29 @@ def publish_incremental(
     deleted: Iterable[Path],
 ) -> PublishResult:
     result = PublishResult()
+    previous = load_publish_manifest(published_dir).get("files") or {}
+    result.files = dict(previous)
     for path in changed:
         rel = path.relative_to(mirror_dir)
+        rel_posix = rel.as_posix()
         dest = published_dir / rel
         try:
-            _write_normalized(path, dest)
-            result.files_written += 1
+            st = path.stat()
+            # Same mtime + size as the last publish (e.g. a no-op touch): keep it.
+            if _entry_matches(previous.get(rel_posix), st) and dest.exists():
+                continue
+            written, digest = _write_normalized(path, dest)
+            if written:
+                result.files_written += 1
+            result.files[rel_posix] = _manifest_entry(st, digest)
         except ImportErrorWithHint as exc:
-            result.errors.append(f"{rel.as_posix()}: {exc}")
+            result.errors.append(f"{rel_posix}: {exc}")
         except Exception as exc:
-            result.errors.append(f"{rel.as_posix()}: {exc}")
+            result.errors.append(f"{rel_posix}: {exc}")
 
     for path in deleted:
         rel = path.relative_to(mirror_dir)
+        result.files.pop(rel.as_posix(), None)
         dest = published_dir / rel
         if dest.exists():
             dest.unlink()
@@ -121,19 +360,41 @@ def publish_incremental(
 
 
 def _prune_empty_dirs(start: Path, stop: Path) -> None:
-    cur = start
-    while cur != stop and stop in cur.parents:
-        if any(cur.iterdir()):
-            break
-        cur.rmdir()
-        cur = cur.parent
+    # Walk up as plain strings; "below stop" is a prefix test rather than a
+    # scan of Path.parents on every step.
+    stop_str = os.fspath(stop)
+    stop_prefix = os.path.join(stop_str, "")
+    cur = os.fspath(start)
+    while cur != stop_str and cur.startswith(stop_prefix):
+        with os.scandir(cur) as it:
+            if next(it, None) is not None:
+                break
+        os.rmdir(cur)
+        cur = os.path.dirname(cur)
 
 
-def write_publish_manifest(source_id: str, published_dir: Path, head_commit: str, files_written: int) -> None:
+def load_publish_manifest(published_dir: Path) -> Dict[str, Any]:
+    path = published_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_publish_manifest(
+    source_id: str,
+    published_dir: Path,
+    head_commit: str,
+    files_written: int,
+    files: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> None:
     manifest = {
         "source_id": source_id,
         "head_commit": head_commit,
         "files_written": files_written,
+        "files": files or {},
     }
-    path = published_dir / "publish_manifest.json"
-    path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    _atomic_write_bytes(published_dir / MANIFEST_NAME, json.dumps(manifest, indent=2).encode("utf-8"))
@@ -110,7 +110,7 @@ def sync_source(source_id: str, progress_cb: Optional[Callable[[str], None]] = N
         state.files_indexed = _count_published_files(published_dir)
         save_state(source_id, state)
         _progress("Writing publish manifest")
-        write_publish_manifest(source.source_id, published_dir, head_after, result.files_written)
+        write_publish_manifest(source.source_id, published_dir, head_after, result.files_written, result.files)
 
         return SyncResult(True, "Sync complete", state.files_indexed, head_after)
     except Exception as exc:
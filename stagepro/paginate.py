@@ -1,7 +1,7 @@
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 from PySide6.QtGui import QTextDocument
 
-from .render import render_page_html
+from .render import page_parts, render_page_from_parts
 
 def measure_height(html: str, width_px: int) -> float:
     doc = QTextDocument()
@@ -13,7 +13,7 @@ def paginate_to_fit(
     cfg: dict,
     song,
     song_filename: str,
-    chunks: List[str],
+    chunks: Iterable[str],
     width_px: int,
     height_px: int,
 ) -> List[str]:
@@ -25,24 +25,34 @@ def paginate_to_fit(
     bottom_reserve = int(ui.get("page_bottom_reserve_px", 64))
     usable_h = max(200, height_px - bottom_reserve)
 
+    # CSS and the title header are the same on every page: build them once,
+    # not once per measurement.
+    parts = page_parts(cfg, song, song_filename)
+
     pages_chunks: List[List[str]] = []
     current: List[str] = []
 
+    # One measuring document and text width for the whole song; measure_height()
+    # would set both up again for every chunk.
+    doc = QTextDocument()
+    text_width = max(200, width_px)
+
     def would_fit(test_chunks: List[str]) -> bool:
         # Temporarily render as page 1/1 for measurement. Footer/hint are fixed, so they don't affect flow.
-        html = render_page_html(cfg, song, song_filename, 1, 1, test_chunks)
-        h = measure_height(html, width_px)
-        return h <= usable_h
+        html = render_page_from_parts(parts, 1, 1, test_chunks)
+        doc.setHtml(html)
+        doc.setTextWidth(text_width)
+        return float(doc.size().height()) <= usable_h
 
     for ch in chunks:
         if not current:
             current = [ch]
             continue
 
-        test = current + [ch]
-        if would_fit(test):
-            current = test
-        else:
+        # Try the chunk in place rather than copying the page's list each time.
+        current.append(ch)
+        if not would_fit(current):
+            current.pop()
             pages_chunks.append(current)
             current = [ch]
 
@@ -56,5 +66,5 @@ def paginate_to_fit(
     total = len(pages_chunks)
     pages: List[str] = []
     for i, body in enumerate(pages_chunks, start=1):
-        pages.append(render_page_html(cfg, song, song_filename, i, total, body))
+        pages.append(render_page_from_parts(parts, i, total, body))
     return pages
@@ -1,26 +1,54 @@
+import os
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
 
 SUPPORTED_EXTS = {".cho", ".pro", ".chopro", ".txt"}
 
-def list_song_files_alpha_from_roots(roots: Sequence[Path], cfg: dict) -> List[Path]:
-    setlist_name = (cfg.get("setlist", {}) or {}).get("filename", "setlist.txt").lower()
+def setlist_filename(cfg: dict) -> str:
+    return (cfg.get("setlist", {}) or {}).get("filename", "setlist.txt")
+
+def list_song_files_in_root(root: Path, cfg: dict) -> List[Path]:
+    """Song files directly inside root (unsorted), skipping the setlist file."""
+    return scan_song_root(root, cfg)[0]
+
+def scan_song_root(root: Path, cfg: dict) -> Tuple[List[Path], Set[str]]:
+    """One scandir pass over root: (song files as list_song_files_in_root, lowercased names of all files)."""
+    setlist_name = setlist_filename(cfg).lower()
+    files: List[Path] = []
+    names: Set[str] = set()
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                lower = entry.name.lower()
+                names.add(lower)
+                # Same suffix as Path(name).suffix: "..pro" has one, a bare ".pro" does not.
+                dot = lower.rfind(".")
+                if dot <= 0 or lower[dot:] not in SUPPORTED_EXTS:
+                    continue
+                if lower == setlist_name:  # ignore setlist file as a song
+                    continue
+                files.append(root / entry.name)
+    except OSError:  # missing root or not a directory
+        return [], set()
+    return files, names
+
+def merge_song_roots(per_root: Iterable[Sequence[Path]]) -> List[Path]:
+    """Merge per-root listings alphabetically; earlier roots win on name clashes."""
     files_by_name: dict[str, Path] = {}
-    for root in roots:
-        if not root.exists() or not root.is_dir():
-            continue
-        for p in root.iterdir():
-            if not p.is_file():
-                continue
-            if p.suffix.lower() not in SUPPORTED_EXTS:
-                continue
-            if p.name.lower() == setlist_name:  # ignore setlist file as a song
-                continue
+    for files in per_root:
+        for p in files:
             key = p.name.lower()
             if key not in files_by_name:
                 files_by_name[key] = p
-    files = sorted(files_by_name.values(), key=lambda x: x.name.lower())
-    return files
+    return sorted(files_by_name.values(), key=lambda x: x.name.lower())
+
+def list_song_files_alpha_from_roots(roots: Sequence[Path], cfg: dict) -> List[Path]:
+    return merge_song_roots(list_song_files_in_root(root, cfg) for root in roots)
 
 
 def list_song_files_alpha(songs_dir: Path, cfg: dict) -> List[Path]:
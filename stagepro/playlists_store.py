@@ -141,6 +141,17 @@ class PlaylistStore:
         pl.items = list(items)
         self.save()
 
+    def move_item(self, playlist_id: str, from_index: int, to_index: int, persist: bool = True) -> None:
+        """Move one item; with persist=False the caller is responsible for a later save()."""
+        pl = self.playlists.get(playlist_id)
+        if not pl:
+            return
+        if not (0 <= from_index < len(pl.items) and 0 <= to_index < len(pl.items)):
+            return
+        pl.items.insert(to_index, pl.items.pop(from_index))
+        if persist:
+            self.save()
+
     def remove_items_by_index(self, playlist_id: str, indices: List[int]) -> None:
         pl = self.playlists.get(playlist_id)
         if not pl:
@@ -1,12 +1,12 @@
-from typing import List, Tuple, Optional
+import io
+import json
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional
 from .chordpro import Song, Block, Line, Token
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
 def escape_html(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-         .replace("<", "&lt;")
-         .replace(">", "&gt;")
-         .replace('"', "&quot;")
-    )
+    return s.translate(_HTML_ESCAPE)
 
 def song_label_title(song: Song, fallback: str) -> Tuple[str, str, str]:
     title = song.meta.get("title", fallback or "Untitled")
@@ -19,6 +19,20 @@ def song_label_title(song: Song, fallback: str) -> Tuple[str, str, str]:
     return title, subtitle, " • ".join(meta_bits)
 
 def stagepro_css(cfg: dict) -> str:
+    """
+    CSS for a rendered page. Only the font/colors/ui sections matter, so the
+    result is cached on a JSON snapshot of those (pages of one song share it).
+    """
+    frozen_cfg = json.dumps(
+        {k: cfg.get(k) or {} for k in ("font", "colors", "ui")},
+        sort_keys=True,
+        default=str,
+    )
+    return _stagepro_css_cached(frozen_cfg)
+
+@lru_cache(maxsize=32)
+def _stagepro_css_cached(frozen_cfg: str) -> str:
+    cfg = json.loads(frozen_cfg)
     font = cfg.get("font", {}) or {}
     colors = cfg.get("colors", {}) or {}
     ui = cfg.get("ui", {}) or {}
@@ -169,47 +183,86 @@ def tokens_to_segments(tokens: List[Token]) -> List[Tuple[Optional[str], str]]:
         segs.append((pending_chord, " "))
     return segs
 
+_LINE_OPEN = {False: "<div class='line'>", True: "<div class='line chorusline'>"}
+
 def render_line_html(line: Line, chorus: bool) -> str:
-    segs = tokens_to_segments(line.tokens)
+    # Chords often repeat within a line; escape each distinct chord once.
+    chord_attrs: Dict[str, str] = {}
 
-    parts: List[str] = []
-    klass = "line chorusline" if chorus else "line"
-    parts.append(f"<div class='{klass}'>")
+    def _seg_html(chord: Optional[str], lyric: str) -> str:
+        if not chord:
+            return f"<span class='seg'>{escape_html(lyric)}</span>"
+        attr = chord_attrs.get(chord)
+        if attr is None:
+            attr = chord_attrs[chord] = escape_html(chord)
+        return f"<span class='seg' data-chord='{attr}'>{escape_html(lyric)}</span>"
 
-    for chord, lyric in segs:
-        lyric_html = escape_html(lyric)
-        if chord:
-            parts.append(f"<span class='seg' data-chord='{escape_html(chord)}'>{lyric_html}</span>")
-        else:
-            parts.append(f"<span class='seg'>{lyric_html}</span>")
+    body = "".join([_seg_html(chord, lyric) for chord, lyric in tokens_to_segments(line.tokens)])
+    return f"{_LINE_OPEN[chorus]}{body}</div>"
 
-    parts.append("</div>")
-    return "".join(parts)
+_SPACER_HTML = "<div class='spacer'></div>"
 
-def song_to_chunks(song: Song) -> List[str]:
+def song_to_chunks(song: Song) -> Iterator[str]:
     """
-    Produce a flat list of HTML chunks at safe breakpoints:
+    Yield HTML chunks at safe breakpoints:
     - comment chunks
     - spacer chunks
     - individual line chunks (verse/chorus)
     """
-    chunks: List[str] = []
+    # Spacers are held back until another chunk follows, so trailing ones are dropped.
+    pending_spacers = 0
 
     for block in song.blocks:
         if block.kind == "comment":
-            chunks.append(f"<div class='comment'>{escape_html(block.text or '')}</div>")
+            yield from [_SPACER_HTML] * pending_spacers
+            pending_spacers = 0
+            yield f"<div class='comment'>{escape_html(block.text or '')}</div>"
             continue
         
         chorus = (block.kind == "chorus")
         for ln in block.lines:
-            chunks.append(render_line_html(ln, chorus=chorus))
-        chunks.append("<div class='spacer'></div>")  # blank line between blocks
+            yield from [_SPACER_HTML] * pending_spacers
+            pending_spacers = 0
+            yield render_line_html(ln, chorus=chorus)
+        pending_spacers += 1  # blank line between blocks
+
+class PageParts(NamedTuple):
+    """The parts of a page that don't depend on its number or body."""
+    head: str       # document start, CSS and the title/subtitle/meta header
+    filename: str   # escaped filename for the footer
+
+
+def page_parts(cfg: dict, song: Song, song_filename: str) -> PageParts:
+    title, subtitle, meta_line = song_label_title(song, song_filename)
+
+    css = stagepro_css(cfg)
+    out = io.StringIO()
+    out.write(f"<html><head><style>{css}</style></head><body>")
+    out.write("<div class='wrap'>")
+    out.write(f"<div class='title'>{escape_html(title)}</div>")
+    if subtitle:
+        out.write(f"<div class='subtitle'>{escape_html(subtitle)}</div>")
+    if meta_line:
+        out.write(f"<div class='meta'>{meta_line}</div>")
+    return PageParts(out.getvalue(), escape_html(song_filename))
+
+
+def render_page_from_parts(
+    parts: PageParts,
+    page_num: int,
+    page_total: int,
+    body_chunks: Iterable[str],
+) -> str:
+    out = io.StringIO()
+    out.write(parts.head)
+    for chunk in body_chunks:
+        out.write(chunk)
 
-    # Trim trailing spacer if present
-    while chunks and chunks[-1].strip() == "<div class='spacer'></div>":
-        chunks.pop()
+    out.write(f"<div class='footer'>{parts.filename} • Page {page_num} / {page_total}</div>")
+    out.write("<div class='hint'>PgUp/PgDn • Hold PgUp+PgDn OR ←+→ to exit</div>")
+    out.write("</div></body></html>")
+    return out.getvalue()
 
-    return chunks
 
 def render_page_html(
     cfg: dict,
@@ -217,29 +270,14 @@ def render_page_html(
     song_filename: str,
     page_num: int,
     page_total: int,
-    body_chunks: List[str],
+    body_chunks: Iterable[str],
 ) -> str:
     """
     Render a single page as HTML.
 
     Theming is handled upstream by merging theme colors into cfg["colors"].
     This function should not load theme files (keeps pagination/render deterministic).
+    To render many pages of one song, build page_parts() once and call
+    render_page_from_parts() per page.
     """
-    title, subtitle, meta_line = song_label_title(song, song_filename)
-
-    css = stagepro_css(cfg)
-    out: List[str] = []
-    out.append(f"<html><head><style>{css}</style></head><body>")
-    out.append("<div class='wrap'>")
-    out.append(f"<div class='title'>{escape_html(title)}</div>")
-    if subtitle:
-        out.append(f"<div class='subtitle'>{escape_html(subtitle)}</div>")
-    if meta_line:
-        out.append(f"<div class='meta'>{meta_line}</div>")
-
-    out.extend(body_chunks)
-
-    out.append(f"<div class='footer'>{escape_html(song_filename)} • Page {page_num} / {page_total}</div>")
-    out.append("<div class='hint'>PgUp/PgDn • Hold PgUp+PgDn OR ←+→ to exit</div>")
-    out.append("</div></body></html>")
-    return "".join(out)
+    return render_page_from_parts(page_parts(cfg, song, song_filename), page_num, page_total, body_chunks)
@@ -35,6 +35,13 @@ class Theme:
         self.colors = data.get("colors", {})
         self.styles = data.get("styles", {})
 
+        # Themes are static for a session, so resolve the fallback chains once.
+        self._resolved = {
+            key: self._resolve_color(key)
+            for key in (*DEFAULT_COLORS, *self.colors)
+        }
+        self._resolved_styles = {key: self._resolve_style(key) for key in self.styles}
+
     # ---------- Loading ----------
 
     @classmethod
@@ -80,18 +87,28 @@ class Theme:
         """
         Resolve a color for a semantic key with fallbacks.
         """
+        color = self._resolved.get(key)
+        if color is None:
+            color = self._resolved[key] = self._resolve_color(key)
+        return color
+
+    def style_for(self, key: str) -> str:
+        """
+        Resolve font styles (bold, italic) for a semantic key.
+        """
+        return self._resolved_styles.get(key, "")
+
+    def _resolve_color(self, key: str) -> str:
+        group = key.split(".")[0]
         return (
             self.colors.get(key)
-            or self.colors.get(key.split(".")[0])
+            or self.colors.get(group)
             or DEFAULT_COLORS.get(key)
-            or DEFAULT_COLORS.get(key.split(".")[0])
+            or DEFAULT_COLORS.get(group)
             or DEFAULT_COLORS["lyrics"]
         )
 
-    def style_for(self, key: str) -> str:
-        """
-        Resolve font styles (bold, italic) for a semantic key.
-        """
+    def _resolve_style(self, key: str) -> str:
         styles = self.styles.get(key, [])
         css = []
 
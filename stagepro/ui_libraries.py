@@ -60,6 +60,8 @@ class LibrariesManagerDialog(QDialog):
 
         self._threads: dict[str, QThread] = {}
         self._workers: dict[str, SyncWorker] = {}
+        # Spawns `git --version`; checked once per dialog rather than on every refresh.
+        self._git_available = git_client.is_git_available()
 
         layout = QVBoxLayout(self)
 
@@ -107,7 +109,7 @@ class LibrariesManagerDialog(QDialog):
         self._refresh()
 
     def _refresh(self) -> None:
-        git_available = git_client.is_git_available()
+        git_available = self._git_available
         if not git_available:
             self.git_banner.setText("Git is required to sync GitHub libraries. Install Git and restart StagePro.")
         else:
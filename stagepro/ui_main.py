@@ -1,13 +1,20 @@
+from collections import OrderedDict
 from pathlib import Path
 import copy
+import hashlib
 import json
 import re
+import time
 from typing import List, Optional, Tuple
 
 from PySide6.QtCore import (
     Qt,
     QEvent,
+    QObject,
+    QRunnable,
+    QThreadPool,
     QTimer,
+    Signal,
     QRectF,
     QSize,
     QRect,
@@ -51,8 +58,15 @@ from PySide6.QtWidgets import (
     QTextEdit,
 )
 
-from .config import load_or_create_config, resolve_songs_path
-from .playlist import list_song_files_alpha_from_roots
+from .config import (
+    default_config,
+    load_or_create_config,
+    merge_defaults,
+    parse_config_bytes,
+    resolve_songs_path,
+    save_config,
+)
+from .playlist import merge_song_roots, scan_song_root, setlist_filename
 from .playlists_store import PlaylistStore
 from .chordpro import Song, parse_chordpro
 from .chordpro_edit import upsert_directives
@@ -60,6 +74,7 @@ from .importers import (
     ImportErrorWithHint,
     import_user_file_to_chordpro,
     choose_destination_path,
+    decode_song_bytes,
 )
 from .musicbrainz import MusicBrainzClient, MBRecordingHit
 from .config import get_user_config_dir
@@ -67,21 +82,75 @@ from .paths import overrides_dir
 from .libraries.model import load_libraries_config
 from .render import song_to_chunks
 from .paginate import paginate_to_fit
+from .ui_song_list import SongFilterModel, SongListView
+
+# Parsed songs / paginated pages kept per window (LRU).
+_SONG_CACHE_SIZE = 64
+
+# Library search: wait for a pause in typing, and ignore one-letter queries
+# (they match nearly everything anyway).
+_SEARCH_DEBOUNCE_MS = 150
+_SEARCH_MIN_CHARS = 2
+
+# Repaginate once a window resize settles instead of on every resize step.
+_RESIZE_SETTLE_MS = 80
+
+# Preview the maintenance selection once arrow-key navigation pauses.
+_PREVIEW_DEBOUNCE_MS = 120
+
+# Write the playlist store once a run of Move Up/Down presses pauses.
+_ORDER_SAVE_DELAY_MS = 300
+
+# Coalesce bursts of reload requests (editor multi-writes, repeated keypresses).
+_RELOAD_DEBOUNCE_MS = 50
+
+# Pedal keys as bits, so held-key combo checks are a single mask test per event.
+_PEDAL_BITS = {
+    int(Qt.Key_PageUp): 1,
+    int(Qt.Key_PageDown): 2,
+    int(Qt.Key_Left): 4,
+    int(Qt.Key_Right): 8,
+}
+_PAGE_PAIR = 1 | 2
+_ARROW_PAIR = 4 | 8
+# Key groups for eventFilter, resolved once instead of per key event.
+_REMOVE_KEYS = frozenset((int(Qt.Key_Delete), int(Qt.Key_Backspace)))
+_NEXT_KEYS = frozenset((int(Qt.Key_PageDown), int(Qt.Key_Right)))
+_PREV_KEYS = frozenset((int(Qt.Key_PageUp), int(Qt.Key_Left)))
+_PEDAL_PARTNER = {
+    int(Qt.Key_PageUp): int(Qt.Key_PageDown),
+    int(Qt.Key_PageDown): int(Qt.Key_PageUp),
+    int(Qt.Key_Left): int(Qt.Key_Right),
+    int(Qt.Key_Right): int(Qt.Key_Left),
+}
+
+# Matches whole directive lines anywhere in a song's text. Whitespace classes
+# exclude "\n" so a match never runs across lines.
+_DIRECTIVE_LINE_RE = re.compile(
+    r"^[^\S\n]*\{[^\S\n]*([^}:\n]+)[^\S\n]*:[^\S\n]*([^}\n]*)\}[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+def _theme_file(base_dir: str, cfg: dict) -> Optional[Path]:
+    """Resolve cfg['theme'] / cfg['theme_path'] against base_dir (None if unset)."""
+    theme_ref = (cfg.get("theme") or cfg.get("theme_path") or "").strip()
+    if not theme_ref:
+        return None
+    p = Path(theme_ref)
+    if not p.is_absolute():
+        p = Path(base_dir) / p
+    return p
 
 def _load_theme_colors(base_dir: str, cfg: dict) -> dict:
     """
     Loads theme JSON from cfg['theme'] or cfg['theme_path'].
     Returns a dict of color overrides (possibly empty).
     """
-    theme_ref = (cfg.get("theme") or cfg.get("theme_path") or "").strip()
-    if not theme_ref:
+    p = _theme_file(base_dir, cfg)
+    if p is None:
         print("[theme] no theme configured")
         return {}
 
-    p = Path(theme_ref)
-    if not p.is_absolute():
-        p = Path(base_dir) / p
-
     if not p.exists():
         print(f"[theme] theme file not found: {p}")
         return {}
@@ -112,6 +181,42 @@ def _list_theme_files(base_dir: Path) -> list[Path]:
     return out
 
 
+class _PaginateSignals(QObject):
+    # token, pages key, pages (or None), error message (or None)
+    done = Signal(int, object, object, object)
+
+
+class _PaginateTask(QRunnable):
+    """Paginate an already-parsed song on a worker thread.
+
+    Only reads its inputs (the song and the cached effective cfg are never
+    mutated once built); results go back to the GUI thread via `signals`.
+    """
+
+    def __init__(self, signals: _PaginateSignals, token: int, key: tuple, eff_cfg: dict,
+                 song: Song, filename: str, w: int, h: int):
+        super().__init__()
+        self.signals = signals
+        self.token = token
+        self.key = key
+        self.eff_cfg = eff_cfg
+        self.song = song
+        self.filename = filename
+        self.w = w
+        self.h = h
+
+    def run(self) -> None:
+        try:
+            pages = paginate_to_fit(self.eff_cfg, self.song, self.filename, song_to_chunks(self.song), self.w, self.h)
+            result = (pages, None)
+        except Exception as e:
+            result = (None, str(e))
+        try:
+            self.signals.done.emit(self.token, self.key, *result)
+        except RuntimeError:
+            pass  # window already gone
+
+
 class PreferencesDialog(QDialog):
     def __init__(self, parent, base_dir: Path, cfg: dict):
         super().__init__(parent)
@@ -219,6 +324,10 @@ class StageProWindow(QMainWindow):
         self.base_dir = base_dir
 
         self.config_path, self.cfg = load_or_create_config(base_dir)
+        # (cfg object, effective cfg, fingerprint, theme stamp); see _effective_cfg
+        self._effective_cfg_cache: Optional[tuple] = None
+        # (mtime_ns, size) of the config file when self.cfg last matched it; see reload_config
+        self._cfg_stamp: Optional[tuple] = None
 
         # Ensure songs_path is resolved (portable-aware) even if cfg came from older file
         self.cfg["songs_path"] = resolve_songs_path(self.cfg.get("songs_path"))
@@ -233,6 +342,11 @@ class StageProWindow(QMainWindow):
         self.playlists.load_or_init()
 
         self.song_files = []  # will be built from active playlist
+        self._song_index_cache: Optional[tuple] = None  # (song_files list, index); see _song_index_by_path
+        # screen name -> (effective cfg fingerprint, html); see _screen_html
+        self._screen_html_cache: dict[str, Tuple[str, str]] = {}
+        # (playlist names, their lowercased set); see _playlist_names_lower
+        self._playlist_lower_cache: Optional[tuple] = None
         self._refresh_song_list()
 
         self.song_idx = 0
@@ -245,16 +359,23 @@ class StageProWindow(QMainWindow):
         # On-stage viewer (existing rendering pipeline)
         self.viewer = QTextBrowser()
         self.viewer.setOpenExternalLinks(False)
+        self._viewer_html: Optional[str] = None  # last HTML passed to the viewer; see _show_html
         self.viewer.setStyleSheet("QTextBrowser { border: none; }")
 
         self.scene = QGraphicsScene(self)
+        # A single item never needs the BSP index the scene keeps by default.
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.proxy = self.scene.addWidget(self.viewer)
 
         self.view = QGraphicsView(self.scene)
         self.view.setFrameShape(QGraphicsView.NoFrame)
+        # The proxy fills the view and is not antialiased, so page flips can
+        # repaint exactly its exposed rect.
+        self.view.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
         self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.view.setAlignment(Qt.AlignCenter)
+        self._last_fit_key: Optional[tuple] = None  # see _fit_view_to_content
 
         # Maintenance UI (playlist + library + actions)
         self.maint_root = QWidget(self)
@@ -269,10 +390,13 @@ class StageProWindow(QMainWindow):
         self.search_box.setPlaceholderText("Search library")
 
         self.lbl_playlist = QLabel("Playlist", self.maint_left)
-        self.maint_playlist_list = QListWidget(self.maint_left)
+        self.maint_playlist_list = SongListView(self.maint_left)
 
         self.lbl_library = QLabel("Library", self.maint_left)
-        self.maint_library_list = QListWidget(self.maint_left)
+        self.maint_library_list = SongListView(self.maint_left)
+        # Search narrows the library through this proxy; rows stay the full listing.
+        self.maint_library_filter = SongFilterModel(self.maint_library_list.song_model(), self)
+        self.maint_library_list.setModel(self.maint_library_filter)
 
         self.maint_left_layout.addWidget(self.search_box)
         self.maint_left_layout.addWidget(self.lbl_playlist)
@@ -284,6 +408,7 @@ class StageProWindow(QMainWindow):
         self.maint_preview = QTextBrowser(self.maint_root)
         self.maint_preview.setOpenExternalLinks(False)
         self.maint_preview.setStyleSheet("QTextBrowser { border: 1px solid #333; }")
+        self._maint_preview_html: Optional[str] = None  # page currently shown, see _preview_song_in_maintenance
 
         self.btn_import = QPushButton("Import Songs…")
         self.btn_save_setlist = QPushButton("Save Setlist")
@@ -314,9 +439,60 @@ class StageProWindow(QMainWindow):
         self.page_index = 0
         self.blackout = False
 
+        # Parse/pagination caches so flicking between songs or resizing back to
+        # a previous size doesn't redo the heavy work. Songs are keyed by a
+        # digest of the file's bytes (looked up via (path, mtime_ns, size) so
+        # unchanged files aren't re-read); pages additionally by config + page
+        # size. A touched-but-identical file or a local copy of a library song
+        # therefore reuses the parse and, for the same filename, the pages.
+        self._song_key: Optional[str] = None
+        self._digest_by_stat: "OrderedDict[tuple, str]" = OrderedDict()
+        self._song_cache: "OrderedDict[str, Song]" = OrderedDict()
+        self._pages_cache: "OrderedDict[tuple, List[str]]" = OrderedDict()
+
+        # On-stage pagination runs on the global thread pool. Each request bumps
+        # the token so results for a superseded song/size are dropped.
+        self._render_pool = QThreadPool.globalInstance()
+        self._render_token = 0
+        self._pending_pages_key: Optional[tuple] = None
+        self._shown_pages_key: Optional[tuple] = None  # key of the pages in self.pages
+        self._pending_last_page = False
+        self._paginate_signals = _PaginateSignals(self)
+        self._paginate_signals.done.connect(self._on_pages_ready)
+
+        # Once a song is on screen, paginate its neighbours in the background
+        # so next/prev song usually hits _pages_cache.
+        self._prefetching: set = set()  # pages keys with a prefetch task in flight
+        self._prefetch_signals = _PaginateSignals(self)
+        self._prefetch_signals.done.connect(self._on_prefetch_ready)
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(0)
+        self._prefetch_timer.timeout.connect(self._prefetch_adjacent_songs)
+
+        self._resize_debounce = QTimer(self)
+        self._resize_debounce.setSingleShot(True)
+        self._resize_debounce.setInterval(_RESIZE_SETTLE_MS)
+        self._resize_debounce.timeout.connect(self._on_resize_settled)
+
+        # Show, mode switch, resize-settle and preferences can all ask for a
+        # repagination in the same event-loop pass; run it once, when idle.
+        self._repaginate_timer = QTimer(self)
+        self._repaginate_timer.setSingleShot(True)
+        self._repaginate_timer.setInterval(0)
+        self._repaginate_timer.timeout.connect(self._repaginate_and_render)
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(_RELOAD_DEBOUNCE_MS)
+        self._reload_timer.timeout.connect(self._reload_config_now)
+        self._reload_error_shown: set = set()  # config paths whose reload failure was already reported
+
+        # Layout and pedal settings read on every resize/keypress; refreshed whenever self.cfg changes.
+        self._apply_cfg_settings()
+
         # Exit combo (hold both pedal buttons)
-        self.pressed_keys = set()
-        self.exit_hold_ms = int((self.cfg.get("shortcuts", {}) or {}).get("exit_hold_ms", 1500))
+        self._pressed_mask = 0  # _PEDAL_BITS of the pedal keys currently held
         self.exit_timer = QTimer(self)
         self.exit_timer.setSingleShot(True)
         self.exit_timer.timeout.connect(self._exit_if_still_held)
@@ -324,20 +500,26 @@ class StageProWindow(QMainWindow):
         QApplication.instance().installEventFilter(self)
 
         # On-stage toggle combo: quick press of both footswitches.
-        self._combo_window_ms = int((self.cfg.get("shortcuts", {}) or {}).get("toggle_onstage_combo_ms", 180))
-        self._last_pedal_down: dict[int, int] = {}  # key -> ms timestamp
+        self._last_pedal_down: dict[int, int] = {}  # key -> monotonic ns timestamp
         self._combo_latched = False
 
-        # MusicBrainz client (metadata-only)
-        cache_path = get_user_config_dir() / "musicbrainz_cache.json"
-        self.mb = MusicBrainzClient(cache_path=cache_path)
+        # MusicBrainz client (metadata-only); created on first use, see `mb`.
+        self._mb_cache_path = get_user_config_dir() / "musicbrainz_cache.json"
+        self._mb: Optional[MusicBrainzClient] = None
 
         self._build_actions()
         self.setWindowTitle("StagePro")
         self._load_first_song_or_welcome()
-        self._refresh_maintenance_list()
+        # Fills the maintenance lists too; no separate refresh needed first.
         self._set_mode("maintenance")
 
+    @property
+    def mb(self) -> MusicBrainzClient:
+        # Loading the cache JSON is only worth it once someone actually autofills.
+        if self._mb is None:
+            self._mb = MusicBrainzClient(cache_path=self._mb_cache_path)
+        return self._mb
+
     # ---------- Config helpers ----------
 
     def _theme_path(self) -> str:
@@ -349,7 +531,15 @@ class StageProWindow(QMainWindow):
         return (cfg.get("theme") or cfg.get("theme_path") or "").strip()
 
     def _save_config(self) -> None:
-        self.config_path.write_text(json.dumps(self.cfg, indent=2), encoding="utf-8")
+        save_config(self.config_path, self.cfg)
+        self._cfg_stamp = self._config_file_stamp()
+
+    def _config_file_stamp(self) -> Optional[tuple]:
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     def open_preferences(self) -> None:
         dlg = PreferencesDialog(self, self.base_dir, self.cfg)
@@ -359,6 +549,7 @@ class StageProWindow(QMainWindow):
         # Update config + persist
         self.cfg = dlg.updated_config()
         self._save_config()
+        self._apply_cfg_settings()
 
         # 1) Recompute any cached layout/metrics
         self._apply_orientation_transform()
@@ -368,10 +559,10 @@ class StageProWindow(QMainWindow):
         self.pages = []
 
         if self.song:
-            self._repaginate_and_render()
+            self._schedule_repaginate()
         else:
             # Welcome screen also needs to re-render to pick up theme colors
-            self.viewer.setHtml(self._welcome_html())
+            self._show_html(self._welcome_html())
 
         # 3) Refresh maintenance preview (if visible)
         try:
@@ -380,6 +571,30 @@ class StageProWindow(QMainWindow):
             pass
 
     def _effective_cfg(self) -> dict:
+        """self.cfg with theme colors merged in.
+
+        Cached until self.cfg is replaced or the theme file changes on disk;
+        callers must treat the returned dict as read-only.
+        """
+        return self._effective_cfg_entry()[1]
+
+    def _effective_cfg_fingerprint(self) -> str:
+        """Stable string identifying the current effective config (for cache keys)."""
+        return self._effective_cfg_entry()[2]
+
+    def _effective_cfg_entry(self) -> tuple:
+        theme_file = _theme_file(self.base_dir, self.cfg)
+        try:
+            theme_mtime = theme_file.stat().st_mtime_ns if theme_file is not None else None
+        except OSError:
+            theme_mtime = None
+        stamp = (theme_file, theme_mtime)
+
+        cached = self._effective_cfg_cache
+        # Compare the cfg object itself (not its id) so a replaced config always misses.
+        if cached is not None and cached[0] is self.cfg and cached[3] == stamp:
+            return cached
+
         cfg = dict(self.cfg)
         colors = dict(cfg.get("colors", {}) or {})
 
@@ -388,29 +603,52 @@ class StageProWindow(QMainWindow):
         colors.update(theme_colors)
 
         cfg["colors"] = colors
-        return cfg
+        fingerprint = json.dumps(cfg, sort_keys=True, default=str)
+        self._effective_cfg_cache = (self.cfg, cfg, fingerprint, stamp)
+        return self._effective_cfg_cache
 
-    def _is_portrait(self) -> bool:
-        return (self.cfg.get("orientation") or "landscape").lower() == "portrait"
+    def _apply_cfg_settings(self) -> None:
+        """Snapshot the cfg values used on hot paths (resize, pedal events)."""
+        ui = self.cfg.get("ui", {}) or {}
+
+        self._is_portrait_v = (self.cfg.get("orientation") or "landscape").lower() == "portrait"
 
-    def _portrait_rotation_deg(self) -> int:
         try:
             deg = int(self.cfg.get("portrait_rotation", 90))
         except Exception:
             deg = 90
-        return 270 if deg == 270 else 90
+        self._portrait_rotation_v = 270 if deg == 270 else 90
 
-    def _fit_mode(self) -> str:
-        ui = self.cfg.get("ui", {}) or {}
         v = str(ui.get("fit_mode", "fit")).lower().strip()
-        return "fill" if v == "fill" else "fit"
+        self._fit_mode_v = "fill" if v == "fill" else "fit"
 
-    def _fit_margin_px(self) -> int:
-        ui = self.cfg.get("ui", {}) or {}
         try:
-            return max(0, int(ui.get("fit_margin_px", 8)))
+            self._fit_margin_v = max(0, int(ui.get("fit_margin_px", 8)))
         except Exception:
-            return 8
+            self._fit_margin_v = 8
+
+        # Missing or null "shortcuts" (or a bad value) falls back to the default.
+        try:
+            self.exit_hold_ms = int(self.cfg["shortcuts"]["exit_hold_ms"])
+        except (KeyError, TypeError, ValueError):
+            self.exit_hold_ms = 1500
+        try:
+            self._combo_window_ms = int(self.cfg["shortcuts"]["toggle_onstage_combo_ms"])
+        except (KeyError, TypeError, ValueError):
+            self._combo_window_ms = 180
+        self._combo_window_ns = self._combo_window_ms * 1_000_000
+
+    def _is_portrait(self) -> bool:
+        return self._is_portrait_v
+
+    def _portrait_rotation_deg(self) -> int:
+        return self._portrait_rotation_v
+
+    def _fit_mode(self) -> str:
+        return self._fit_mode_v
+
+    def _fit_margin_px(self) -> int:
+        return self._fit_margin_v
 
     # ---------- Orientation / Fit ----------
 
@@ -421,20 +659,26 @@ class StageProWindow(QMainWindow):
         h = max(200, vp.height() - 2 * margin)
 
         # swap size in portrait so the *rotated* content fills
-        if self._is_portrait():
-            self.viewer.setFixedSize(QSize(h, w))
-        else:
-            self.viewer.setFixedSize(QSize(w, h))
+        target = QSize(h, w) if self._is_portrait() else QSize(w, h)
+        # All reads above, one write below, and only when the size actually
+        # changed; this runs on every resize step.
+        if self.viewer.size() != target or self.viewer.minimumSize() != target:
+            self.viewer.setFixedSize(target)
 
     def _apply_orientation_transform(self):
-        if self._is_portrait():
-            self.proxy.setRotation(self._portrait_rotation_deg())
-        else:
-            self.proxy.setRotation(0)
+        rotation = self._portrait_rotation_deg() if self._is_portrait() else 0
+        # Re-setting the same rotation still invalidates the proxy's transform.
+        if self.proxy.rotation() != rotation:
+            self.proxy.setRotation(rotation)
         self._fit_view_to_content()
 
     def _fit_view_to_content(self):
         self._resize_viewer_to_viewport()
+        # Spurious resizes (show/hide, polish, mode switches) often leave every
+        # input unchanged; the last fitInView is still correct then.
+        fit_key = (self.view.viewport().size(), self.viewer.size(), self.proxy.rotation(), self._fit_mode())
+        if fit_key == self._last_fit_key:
+            return
         rect: QRectF = self.proxy.sceneBoundingRect()
         if rect.isNull():
             return
@@ -443,17 +687,33 @@ class StageProWindow(QMainWindow):
             self.view.fitInView(rect, Qt.KeepAspectRatioByExpanding)
         else:
             self.view.fitInView(rect, Qt.KeepAspectRatio)
+        self._last_fit_key = fit_key
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        # The on-stage view is hidden in maintenance mode; _set_mode("onstage")
+        # fits and repaginates for the final size when it is shown.
+        if self.mode != "onstage":
+            self._resize_debounce.stop()
+            return
         self._fit_view_to_content()
-        # Re-paginate on resize because wrapping changes height
-        self._repaginate_and_render()
+        # Re-paginate on resize because wrapping changes height, but only
+        # once the drag pauses; a resize emits many events per second.
+        self._resize_debounce.start()
+
+    def _on_resize_settled(self) -> None:
+        self._schedule_repaginate()
 
     def showEvent(self, event):
         super().showEvent(event)
         self._apply_orientation_transform()
-        self._repaginate_and_render()
+        self._schedule_repaginate()
+
+    def closeEvent(self, event):
+        # Don't lose a reorder that is still waiting for its deferred save.
+        if self._order_save_timer.isActive():
+            self._flush_playlist_order()
+        super().closeEvent(event)
 
     # ---------- Mode management ----------
 
@@ -464,11 +724,15 @@ class StageProWindow(QMainWindow):
         self.mode = mode
 
         if self.mode == "onstage":
+            # A playlist pick still waiting on the preview debounce must become the active song first.
+            if self._preview_debounce.isActive():
+                self._preview_debounce.stop()
+                self._on_maint_selection_changed()
             self.stack.setCurrentIndex(1)
             self.menuBar().setVisible(False)
             self.showFullScreen()
             self._apply_orientation_transform()
-            self._repaginate_and_render()
+            self._schedule_repaginate()
         else:
             self.stack.setCurrentIndex(0)
             self.menuBar().setVisible(True)
@@ -532,11 +796,23 @@ class StageProWindow(QMainWindow):
         outer.addWidget(split, 1)
         outer.addWidget(self.maint_status)
 
-        self.maint_playlist_list.itemSelectionChanged.connect(self._on_maint_selection_changed)
-        self.maint_library_list.itemSelectionChanged.connect(self._on_maint_selection_changed)
-        self.maint_library_list.itemDoubleClicked.connect(lambda _: self._add_selected_library_to_playlist())
+        self._order_save_timer = QTimer(self)
+        self._order_save_timer.setSingleShot(True)
+        self._order_save_timer.setInterval(_ORDER_SAVE_DELAY_MS)
+        self._order_save_timer.timeout.connect(self._flush_playlist_order)
+        self._preview_debounce = QTimer(self)
+        self._preview_debounce.setSingleShot(True)
+        self._preview_debounce.setInterval(_PREVIEW_DEBOUNCE_MS)
+        self._preview_debounce.timeout.connect(self._on_maint_selection_changed)
+        self.maint_playlist_list.itemSelectionChanged.connect(self._preview_debounce.start)
+        self.maint_library_list.itemSelectionChanged.connect(self._preview_debounce.start)
+        self.maint_library_list.doubleClicked.connect(lambda _: self._add_selected_library_to_playlist())
         self.btn_edit_song.clicked.connect(self._on_edit_song_clicked)
-        self.search_box.textChanged.connect(lambda _: self._refresh_maintenance_list(preserve_selection=True))
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_library_filter)
+        self.search_box.textChanged.connect(lambda _: self._search_timer.start())
         self.btn_import.clicked.connect(self._on_import_clicked)
         self.btn_save_setlist.clicked.connect(self._save_setlist_from_ui)
         self.btn_move_up.clicked.connect(lambda: self._move_selected_item(-1))
@@ -559,18 +835,25 @@ class StageProWindow(QMainWindow):
         self.btn_save_setlist.setToolTip("Export current playlist order to setlist.txt (legacy compatibility)")
 
     def _refresh_playlist_selector(self) -> None:
-        self.cmb_playlist.blockSignals(True)
-        self.cmb_playlist.clear()
-
         active_id = self.playlists.active_playlist_id
         active_index = 0
+        entries = []
         for i, pl in enumerate(self.playlists.list_playlists()):
-            self.cmb_playlist.addItem(pl.name, pl.playlist_id)
+            entries.append((pl.name, pl.playlist_id))
             if pl.playlist_id == active_id:
                 active_index = i
 
-        self.cmb_playlist.setCurrentIndex(active_index)
-        self.cmb_playlist.blockSignals(False)
+        cmb = self.cmb_playlist
+        cmb.blockSignals(True)
+        # Every maintenance refresh lands here; only rebuild the combo when the playlists changed.
+        current = [(cmb.itemText(i), cmb.itemData(i)) for i in range(cmb.count())]
+        if current != entries:
+            cmb.clear()
+            for name, playlist_id in entries:
+                cmb.addItem(name, playlist_id)
+
+        cmb.setCurrentIndex(active_index)
+        cmb.blockSignals(False)
 
     def _load_library_sources(self) -> None:
         self.libraries_cfg = load_libraries_config()
@@ -587,19 +870,87 @@ class StageProWindow(QMainWindow):
             self.library_override_dirs.append(override_dir)
         if not self.library_override_dirs:
             overrides_dir().mkdir(parents=True, exist_ok=True)
+        # Roots may have changed (or been re-synced): drop cached roots and listings.
+        self._song_roots_cache: Optional[List[Path]] = None
+        # resolved published root -> published root; see _library_published_root_for
+        self._published_root_index: Optional[dict[Path, Path]] = None
+        self._invalidate_library_scan()
+
+    def _invalidate_library_scan(self) -> None:
+        # root -> ((dir mtime_ns, setlist filename), song files directly in root,
+        #          lowercased names of every file in root)
+        self._lib_scan_cache: dict[Path, tuple[tuple[int, str], List[Path], set]] = {}
+        # exact filename -> first root's Path, rebuilt with each new merged listing
+        self._name_to_path: dict[str, Path] = {}
+        # (per-root stamps, merged paths); see _library_song_paths
+        self._lib_listing: Optional[tuple] = None
+        # (merged paths, lowercased name -> Path); see _refresh_song_list
+        self._lib_lower_index: Optional[tuple] = None
+
+    def _library_song_paths(self) -> List[Path]:
+        """Alphabetical merged listing of all song roots.
+
+        Each root is only re-listed when its directory mtime changes (adding,
+        removing or renaming a file bumps it), so playlist edits and
+        selection refreshes don't walk every library folder again. When no
+        root changed, the previous merge is reused as-is.
+        """
+        setlist_name = setlist_filename(self.cfg)
+        stamps = []
+        per_root: List[List[Path]] = []
+        for root in self._song_roots():
+            try:
+                stamp = (root.stat().st_mtime_ns, setlist_name)
+            except OSError:
+                self._lib_scan_cache.pop(root, None)
+                continue
+            stamps.append((root, stamp))
+            cached = self._lib_scan_cache.get(root)
+            if cached is not None and cached[0] == stamp:
+                files = cached[1]
+            else:
+                files, names = scan_song_root(root, self.cfg)
+                self._lib_scan_cache[root] = (stamp, files, names)
+            per_root.append(files)
+
+        if self._lib_listing is not None and self._lib_listing[0] == stamps:
+            return self._lib_listing[1]
+
+        name_to_path: dict[str, Path] = {}
+        for files in per_root:
+            for p in files:
+                name_to_path.setdefault(p.name, p)
+        self._name_to_path = name_to_path
+        merged = merge_song_roots(per_root)
+        self._lib_listing = (stamps, merged)
+        return merged
 
     def _song_roots(self) -> List[Path]:
-        roots: List[Path] = []
-        if self.library_override_dirs:
-            roots.extend(self.library_override_dirs)
-        else:
-            roots.append(overrides_dir())
-        roots.append(self.songs_dir)
-        roots.extend(self.library_published_dirs)
+        # Only changes when library sources are (re)loaded; see _load_library_sources.
+        roots = self._song_roots_cache
+        if roots is None:
+            roots = []
+            if self.library_override_dirs:
+                roots.extend(self.library_override_dirs)
+            else:
+                roots.append(overrides_dir())
+            roots.append(self.songs_dir)
+            roots.extend(self.library_published_dirs)
+            self._song_roots_cache = roots
         return roots
 
     def _resolve_song_path(self, name: str) -> Optional[Path]:
+        # Fast path: the index from the last library scan.
+        p = self._name_to_path.get(name)
+        if p is not None:
+            return p
+        lower = name.lower()
         for root in self._song_roots():
+            # The scan also recorded every file name in the root, so names that
+            # are not there at all (stale playlist entries) need no stat calls.
+            cached = self._lib_scan_cache.get(root)
+            if cached is not None and lower not in cached[2]:
+                continue
             candidate = root / name
             if candidate.exists() and candidate.is_file():
                 return candidate
@@ -613,16 +964,15 @@ class StageProWindow(QMainWindow):
         prev_pl = None
         prev_lib = None
         if preserve_selection:
-            pl_items = self.maint_playlist_list.selectedItems()
-            lib_items = self.maint_library_list.selectedItems()
-            if pl_items:
-                prev_pl = pl_items[0].data(Qt.UserRole)
-            if lib_items:
-                prev_lib = lib_items[0].data(Qt.UserRole)
+            prev_pl = self.maint_playlist_list.selected_path()
+            prev_lib = self.maint_library_list.selected_path()
 
         pl = self.playlists.get_active()
         playlist_names = list(pl.items)
 
+        # Library: merged roots (overrides, user songs, published sources).
+        # Scanned first so _resolve_song_path can use the fresh name index.
+        lib_paths = self._library_song_paths()
 
         # Prune stale playlist entries that no longer exist on disk
         missing_idxs = [i for i, name in enumerate(playlist_names) if not self._resolve_song_path(name)]
@@ -634,77 +984,91 @@ class StageProWindow(QMainWindow):
             pl = self.playlists.get_active()
             playlist_names = list(pl.items)
 
-        # Library: merged roots (overrides, user songs, published sources)
-        lib_paths = list_song_files_alpha_from_roots(self._song_roots(), self.cfg)
-        lib_names = [p.name for p in lib_paths]
+        # Repopulate with painting off so the lists repaint once at the end,
+        # not once per reset/selection step.
+        lists = (self.maint_playlist_list, self.maint_library_list)
+        for lst in lists:
+            lst.setUpdatesEnabled(False)
+        try:
+            # Populate playlist list (playlist-only)
+            self.maint_playlist_list.set_rows(
+                (name, str(self._resolve_song_path(name) or (self.songs_dir / name)), True)
+                for name in playlist_names
+            )
 
-        # Search filters the library only (keeps playlist operations predictable)
-        q = (self.search_box.text() or "").strip().lower()
-        if q:
-            lib_names = [n for n in lib_names if q in n.lower()]
-
-        # Populate playlist list (playlist-only)
-        self.maint_playlist_list.clear()
-        for name in playlist_names:
-            p = self._resolve_song_path(name) or (self.songs_dir / name)
-            it = QListWidgetItem(name)
-            it.setData(Qt.UserRole, str(p))
-            self.maint_playlist_list.addItem(it)
-
-        # Populate library list; disable items already in playlist
-        playlist_set = {n.lower() for n in playlist_names}
-        self.maint_library_list.clear()
-        for name in lib_names:
-            p = next((lp for lp in lib_paths if lp.name == name), self.songs_dir / name)
-            it = QListWidgetItem(name)
-            it.setData(Qt.UserRole, str(p))
-            if name.lower() in playlist_set:
-                it.setFlags(it.flags() & ~Qt.ItemIsEnabled)
-            self.maint_library_list.addItem(it)
-
-        # Restore selection
-        def _restore(lst: QListWidget, target):
-            if not target:
-                return False
-            for i in range(lst.count()):
-                if lst.item(i).data(Qt.UserRole) == target:
-                    lst.setCurrentRow(i)
-                    return True
-            return False
+            # Populate library list; disable items already in playlist.
+            # Search is applied by maint_library_filter, not here.
+            playlist_set = self._playlist_names_lower(playlist_names)
+            self.maint_library_list.set_rows(
+                (p.name, str(p), lower not in playlist_set)
+                for lower, p in self._library_lower_index(lib_paths).items()
+            )
+
+            # Restore selection
+            def _restore(lst: SongListView, target):
+                if not target:
+                    return False
+                row = lst.row_of_path(target)
+                if row < 0:
+                    return False
+                lst.setCurrentRow(row)
+                return True
 
-        restored = _restore(self.maint_playlist_list, prev_pl) if prev_pl else False
-        if not restored and prev_lib:
-            _restore(self.maint_library_list, prev_lib)
+            restored = _restore(self.maint_playlist_list, prev_pl) if prev_pl else False
+            if not restored and prev_lib:
+                _restore(self.maint_library_list, prev_lib)
 
+            self._select_default_row()
+        finally:
+            for lst in lists:
+                lst.setUpdatesEnabled(True)
+
+        # Rebuild runtime play order for on-stage mode
+        self._refresh_song_list()
+
+    def _select_default_row(self) -> None:
         # Default selection for preview: playlist selection if available, else library
         if self.maint_playlist_list.count() > 0 and self.maint_playlist_list.currentRow() < 0:
             self.maint_playlist_list.setCurrentRow(0)
         elif self.maint_library_list.count() > 0 and self.maint_library_list.currentRow() < 0:
             self.maint_library_list.setCurrentRow(0)
 
-        # Rebuild runtime play order for on-stage mode
-        self._refresh_song_list()
+    def _apply_library_filter(self) -> None:
+        """Narrow the Library list to the (debounced) search text."""
+        # Search filters the library only (keeps playlist operations predictable)
+        q = (self.search_box.text() or "").strip()
+        self.maint_library_filter.setFilterFixedString(q if len(q) >= _SEARCH_MIN_CHARS else "")
+        self._select_default_row()
+
+    def _playlist_names_lower(self, playlist_names: List[str]) -> frozenset:
+        """Lowercased playlist names, recomputed only when the playlist changed."""
+        key = tuple(playlist_names)
+        cached = self._playlist_lower_cache
+        if cached is None or cached[0] != key:
+            cached = self._playlist_lower_cache = (key, frozenset(n.lower() for n in playlist_names))
+        return cached[1]
 
     def _on_maint_selection_changed(self) -> None:
+        self._preview_debounce.stop()
         path = self._selected_path_for_preview()
         if not path:
-            self.maint_preview.setPlainText("")
+            self._set_maint_preview_text("")
             return
 
         self._preview_song_in_maintenance(path)
 
         # If selection is from the playlist list, make it the active on-stage song too.
-        if self.maint_playlist_list.selectedItems():
+        if self.maint_playlist_list.selected_path():
             self._sync_active_song_to_path(path)
 
     def _selected_path_for_preview(self) -> Optional[Path]:
         """Return selected song Path from either playlist or library list."""
-        pl_items = self.maint_playlist_list.selectedItems()
-        if pl_items:
-            return Path(pl_items[0].data(Qt.UserRole))
-        lib_items = self.maint_library_list.selectedItems()
-        if lib_items:
-            return Path(lib_items[0].data(Qt.UserRole))
+        pl_path = self.maint_playlist_list.selected_path()
+        if pl_path:
+            return Path(pl_path)
+        lib_path = self.maint_library_list.selected_path()
+        if lib_path:
+            return Path(lib_path)
         return None
 
     
@@ -717,16 +1081,7 @@ class StageProWindow(QMainWindow):
                 target = path.resolve()
             except Exception:
                 target = path
-            idx = None
-            for i, p in enumerate(self.song_files):
-                try:
-                    if p.resolve() == target:
-                        idx = i
-                        break
-                except Exception:
-                    if p == path:
-                        idx = i
-                        break
+            idx = self._song_index_by_path().get(target)
             if idx is None:
                 return
             if idx != self.song_idx:
@@ -734,16 +1089,19 @@ class StageProWindow(QMainWindow):
 
 
     def _preview_song_in_maintenance(self, path: Path) -> None:
-        # Guard against stale playlist entries / deleted files
-        if not path.exists():
+        # Loading stats the file anyway, so a missing file shows up as
+        # FileNotFoundError there instead of needing an exists() probe first.
+        try:
+            song_key, song = self._load_song_cached(path)
+        except FileNotFoundError:
+            # Guard against stale playlist entries / deleted files
             msg = f"Song file not found:\n{path}"
             self.maint_status.setText(f"Missing: {path.name} (removing stale entry if needed)")
-            self.maint_preview.setPlainText(msg)
+            self._set_maint_preview_text(msg)
             QMessageBox.warning(self, "StagePro - Missing song file", msg)
 
             # If this came from the playlist list, remove it from the active playlist
-            pl_items = self.maint_playlist_list.selectedItems()
-            if pl_items:
+            if self.maint_playlist_list.selected_path():
                 row = self.maint_playlist_list.currentRow()
                 pl = self.playlists.get_active()
                 if row >= 0 and pl and pl.playlist_id:
@@ -754,29 +1112,21 @@ class StageProWindow(QMainWindow):
                     self._refresh_maintenance_list(preserve_selection=False)
                     self._load_first_song_or_welcome()
             return
-
-        try:
-            try:
-                text = path.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                text = path.read_text(encoding="latin-1")
-        except FileNotFoundError:
-            # Race: file removed after exists() check
-            msg = f"Song file not found:\n{path}"
-            self.maint_status.setText(f"Missing: {path.name} (it may have been moved/deleted)")
-            self.maint_preview.setPlainText(msg)
-            QMessageBox.warning(self, "StagePro - Missing song file", msg)
+        except Exception as e:
+            self._set_maint_preview_text(self._read_song_text_for_edit(path))
+            self.maint_status.setText(f"Selected: {path.name} (parse error: {e})")
             return
 
         try:
-            song = parse_chordpro(text)
-            chunks = song_to_chunks(song)
             # Use a lightweight preview size (avoid needing the onstage graphics view)
             w = 900
             h = 1200
-            eff_cfg = self._effective_cfg()
-            pages = paginate_to_fit(eff_cfg, song, path.name, chunks, w, h)
-            self.maint_preview.setHtml(pages[0] if pages else self._welcome_html())
+            pages = self._paginate_cached(song_key, song, path.name, w, h)
+            html = pages[0] if pages else self._welcome_html()
+            # Pages are cached per song digest + cfg, so an unchanged preview is the same string.
+            if html is not self._maint_preview_html:
+                self.maint_preview.setHtml(html)
+                self._maint_preview_html = html
             missing = []
             if not song.meta.get("title") and not song.meta.get("t"):
                 missing.append("title")
@@ -787,17 +1137,19 @@ class StageProWindow(QMainWindow):
             else:
                 self.maint_status.setText(f"Selected: {path.name}")
         except Exception as e:
-            self.maint_preview.setPlainText(text)
+            self._set_maint_preview_text(self._read_song_text_for_edit(path))
             self.maint_status.setText(f"Selected: {path.name} (parse error: {e})")
 
+    def _set_maint_preview_text(self, text: str) -> None:
+        self.maint_preview.setPlainText(text)
+        self._maint_preview_html = None
+
         # ---------- Local editing in Maintenance ----------
 
     def _read_song_text_for_edit(self, path: Path) -> str:
         """Read song text using UTF-8, falling back to latin-1 if needed."""
-        try:
-            return path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            return path.read_text(encoding="latin-1")
+        # One read; the fallback decodes the same bytes instead of reading again.
+        return decode_song_bytes(path.read_bytes())
 
     def _is_under_dir(self, path: Path, root: Path) -> bool:
         try:
@@ -808,8 +1160,26 @@ class StageProWindow(QMainWindow):
 
     def _library_published_root_for(self, path: Path) -> Optional[Path]:
         """Return the published root dir (published/<source_id>) that contains path."""
-        for pub in (self.library_published_dirs or []):
-            if self._is_under_dir(path, pub):
+        index = self._published_root_index
+        if index is None:
+            index = {}
+            for pub in (self.library_published_dirs or []):
+                try:
+                    index.setdefault(pub.resolve(), pub)
+                except Exception:
+                    continue
+            self._published_root_index = index
+        if not index:
+            return None
+        # Resolve the song once and walk up its parents instead of resolving
+        # it again against every root.
+        try:
+            resolved = path.resolve()
+        except Exception:
+            return None
+        for candidate in (resolved, *resolved.parents):
+            pub = index.get(candidate)
+            if pub is not None:
                 return pub
         return None
 
@@ -837,12 +1207,12 @@ class StageProWindow(QMainWindow):
         if not path:
             QMessageBox.information(self, "Edit Song", "Select a song first.")
             return
-        if not path.exists():
-            QMessageBox.warning(self, "Edit Song", f"Song file not found:\n{path}")
-            return
 
         try:
             text = self._read_song_text_for_edit(path)
+        except FileNotFoundError:
+            QMessageBox.warning(self, "Edit Song", f"Song file not found:\n{path}")
+            return
         except Exception as e:
             QMessageBox.critical(self, "Edit Song", f"Failed to read file:\n{path}\n\n{e}")
             return
@@ -885,12 +1255,13 @@ class StageProWindow(QMainWindow):
         try:
             edit_target.parent.mkdir(parents=True, exist_ok=True)
             edit_target.write_text(new_text, encoding="utf-8")
+            self._invalidate_library_scan()
         except Exception as e:
             QMessageBox.critical(self, "Edit Song", f"Failed to save:\n{edit_target}\n\n{e}")
             return
 
         # If we created a local copy while a playlist item is selected, swap that playlist row to the new local filename.
-        if edit_target != path and self.maint_playlist_list.selectedItems():
+        if edit_target != path and self.maint_playlist_list.selected_path():
             row = self.maint_playlist_list.currentRow()
             if row >= 0:
                 pid = self.playlists.active_playlist_id
@@ -1090,36 +1461,46 @@ class StageProWindow(QMainWindow):
         new_row = row + int(delta)
         if new_row < 0 or new_row >= self.maint_playlist_list.count():
             return
-        it = self.maint_playlist_list.takeItem(row)
-        self.maint_playlist_list.insertItem(new_row, it)
+        self.maint_playlist_list.move_row(row, new_row)
         self.maint_playlist_list.setCurrentRow(new_row)
-        self._persist_current_playlist_order()
-
-    def _persist_current_playlist_order(self) -> None:
+        # Playlist rows mirror the active playlist's items one-to-one, so
+        # apply the same move to the store instead of re-reading every row.
+        # The store is written once the presses pause (any other store
+        # change saves the new order along with it).
         pid = self.playlists.active_playlist_id
-        if not pid:
-            return
-        items = []
-        for i in range(self.maint_playlist_list.count()):
-            it = self.maint_playlist_list.item(i)
-            items.append(Path(it.data(Qt.UserRole)).name)
-        self.playlists.set_items(pid, items)
+        if pid:
+            self.playlists.move_item(pid, row, new_row, persist=False)
+            self._order_save_timer.start()
+
+    def _flush_playlist_order(self) -> None:
+        self._order_save_timer.stop()
+        try:
+            self.playlists.save()
+        except Exception as e:
+            self.maint_status.setText(f"Failed to save playlist order: {e}")
 
     def _add_selected_library_to_playlist(self) -> None:
-        item = self.maint_library_list.currentItem()
-        if not item:
+        current = self.maint_library_list.current_path()
+        if not current:
             return
-        filename = Path(item.data(Qt.UserRole)).name
+        filename = Path(current).name
         self._add_filename_to_active_playlist(filename)
         self._refresh_maintenance_list(preserve_selection=False)
 
     def _add_filename_to_active_playlist(self, filename: str) -> None:
+        self._add_filenames_to_active_playlist([filename])
+
+    def _add_filenames_to_active_playlist(self, filenames: List[str]) -> None:
+        """Append filenames not already in the active playlist; saves once."""
         pl = self.playlists.get_active()
         items = list(pl.items)
-        if filename.lower() in {x.lower() for x in items}:
-            return
-        items.append(filename)
-        self.playlists.set_items(pl.playlist_id, items)
+        seen = {x.lower() for x in items}
+        for filename in filenames:
+            if filename.lower() not in seen:
+                seen.add(filename.lower())
+                items.append(filename)
+        if len(items) != len(pl.items):
+            self.playlists.set_items(pl.playlist_id, items)
 
     def _remove_selected_from_playlist(self) -> None:
         pid = self.playlists.active_playlist_id
@@ -1178,11 +1559,8 @@ class StageProWindow(QMainWindow):
 
     def _save_setlist_from_ui(self) -> None:
         setlist_name = (self.cfg.get("setlist", {}) or {}).get("filename", "setlist.txt")
-        lines = []
-        for i in range(self.maint_playlist_list.count()):
-            it = self.maint_playlist_list.item(i)
-            # store filenames (not absolute paths)
-            lines.append(Path(it.data(Qt.UserRole)).name)
+        # store filenames (not absolute paths)
+        lines = [Path(p).name for p in self.maint_playlist_list.paths()]
         p = self.songs_dir / setlist_name
         p.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
         self.maint_status.setText(f"Saved setlist: {p}")
@@ -1200,15 +1578,21 @@ class StageProWindow(QMainWindow):
 
         imported = 0
         warnings: List[str] = []
+        # Added to the active playlist in one go after the loop (one save, not one per file).
+        added: List[str] = []
+        try:
+            songs_dir_resolved = self.songs_dir.resolve()
+        except Exception:
+            songs_dir_resolved = None
         for fp in files:
             src = Path(fp)
 
             # If the selected file is already in the songs folder, do NOT import/copy it.
             # Just add it to the active playlist.
             try:
-                if src.resolve().parent == self.songs_dir.resolve():
+                if songs_dir_resolved is not None and src.resolve().parent == songs_dir_resolved:
                     if src.exists() and src.is_file():
-                        self._add_filename_to_active_playlist(src.name)
+                        added.append(src.name)
                         imported += 1
                         continue
             except Exception:
@@ -1224,7 +1608,7 @@ class StageProWindow(QMainWindow):
                 dest.write_text(imp.chordpro_text, encoding="utf-8")
                 imported += 1
                 # add to active playlist (at end)
-                self._add_filename_to_active_playlist(dest.name)
+                added.append(dest.name)
 
                 if not imp.title or not imp.artist:
                     warnings.append(f"{src.name}: imported, but title/artist missing in directives (you can autofill from MusicBrainz)")
@@ -1233,6 +1617,9 @@ class StageProWindow(QMainWindow):
             except Exception as e:
                 warnings.append(f"{src.name}: import failed ({e})")
 
+        if added:
+            self._add_filenames_to_active_playlist(added)
+        self._invalidate_library_scan()
         self._refresh_maintenance_list(preserve_selection=False)
         msg = f"Imported {imported} file(s)."
         if warnings:
@@ -1246,24 +1633,22 @@ class StageProWindow(QMainWindow):
         if not path:
             QMessageBox.information(self, "MusicBrainz", "Select a song first.")
             return
-        try:
-            text = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            text = path.read_text(encoding="latin-1")
+        text = self._read_song_text_for_edit(path)
 
-        # Extract title/artist from existing directives if present.
+        # One pass over the directives. Title/artist take the first non-empty
+        # value of either alias in document order; current_meta (used for the
+        # "missing keys" check below) keeps the last value of each key.
         title = ""
         artist = ""
-        for raw in text.splitlines():
-            m = re.match(r"^\s*\{\s*([^}:]+)\s*:\s*([^}]*)\}\s*$", raw, flags=re.IGNORECASE)
-            if not m:
-                continue
+        current_meta: dict[str, str] = {}
+        for m in _DIRECTIVE_LINE_RE.finditer(text):
             k = m.group(1).strip().lower()
             v = m.group(2).strip()
             if k in {"title", "t"} and not title:
                 title = v
             if k in {"artist", "a"} and not artist:
                 artist = v
+            current_meta[k] = v
 
         if not title or not artist:
             QMessageBox.information(
@@ -1299,12 +1684,6 @@ class StageProWindow(QMainWindow):
             updates.setdefault("year", chosen.date.split("-")[0])
 
         # Only apply updates for keys that are currently missing
-        current_meta = {}
-        for raw in text.splitlines():
-            m = re.match(r"^\s*\{\s*([^}:]+)\s*:\s*([^}]*)\}\s*$", raw, flags=re.IGNORECASE)
-            if m:
-                current_meta[m.group(1).strip().lower()] = m.group(2).strip()
-
         filtered_updates = {k: v for k, v in updates.items() if not current_meta.get(k)}
         if not filtered_updates:
             QMessageBox.information(self, "MusicBrainz", "Nothing to autofill — metadata is already present.")
@@ -1353,9 +1732,8 @@ class StageProWindow(QMainWindow):
     # ---------- Exit combo + paging ----------
 
     def _exit_combo_active(self) -> bool:
-        pg_pair = (Qt.Key_PageUp in self.pressed_keys) and (Qt.Key_PageDown in self.pressed_keys)
-        lr_pair = (Qt.Key_Left in self.pressed_keys) and (Qt.Key_Right in self.pressed_keys)
-        return pg_pair or lr_pair
+        mask = self._pressed_mask
+        return (mask & _PAGE_PAIR) == _PAGE_PAIR or (mask & _ARROW_PAIR) == _ARROW_PAIR
 
     def _start_or_stop_exit_timer(self):
         if self._exit_combo_active():
@@ -1375,29 +1753,23 @@ class StageProWindow(QMainWindow):
         Many pedals are configured to emit PageUp/PageDown. We detect a combo
         when both keys are pressed within a short window.
         """
-        if key not in (Qt.Key_PageUp, Qt.Key_PageDown, Qt.Key_Left, Qt.Key_Right):
+        other = _PEDAL_PARTNER.get(key)
+        if other is None:
             return False
 
         # Don't retrigger until both keys are released.
         if self._combo_latched:
             return False
 
-        # Use monotonic time for stable key timing.
-        import time
-        now_ms = int(time.monotonic() * 1000)
-        self._last_pedal_down[key] = now_ms
-
-        # Determine pair
-        if key in (Qt.Key_PageUp, Qt.Key_PageDown):
-            other = Qt.Key_PageDown if key == Qt.Key_PageUp else Qt.Key_PageUp
-        else:
-            other = Qt.Key_Right if key == Qt.Key_Left else Qt.Key_Left
+        # Use monotonic time for stable key timing; integer ns avoids float math per key.
+        now_ns = time.monotonic_ns()
+        self._last_pedal_down[key] = now_ns
 
         other_ts = self._last_pedal_down.get(other)
         if other_ts is None:
             return False
 
-        if abs(now_ms - other_ts) <= self._combo_window_ms:
+        if abs(now_ns - other_ts) <= self._combo_window_ns:
             self._combo_latched = True
             self._toggle_mode()
             return True
@@ -1405,19 +1777,25 @@ class StageProWindow(QMainWindow):
         return False
 
     def eventFilter(self, obj, event):
+        # Installed application-wide, so this sees every paint/mouse/timer event:
+        # only key events are interesting, and only those pay for the modal lookup.
+        etype = event.type()
+        if etype != QEvent.KeyPress and etype != QEvent.KeyRelease:
+            return super().eventFilter(obj, event)
         modal = QApplication.activeModalWidget()
         if modal is not None:
             return False
-        if event.type() == QEvent.KeyPress and not event.isAutoRepeat():
+        if etype == QEvent.KeyPress and not event.isAutoRepeat():
             k = event.key()
+            ctrl = bool(event.modifiers() & Qt.ControlModifier)
 
             # Maintenance: remove from playlist
-            if self.mode == "maintenance" and k in (Qt.Key_Delete, Qt.Key_Backspace):
+            if self.mode == "maintenance" and k in _REMOVE_KEYS:
                 self._remove_selected_from_playlist()
                 return True
 
             # Maintenance: reorder shortcuts
-            if self.mode == "maintenance" and (event.modifiers() & Qt.ControlModifier):
+            if self.mode == "maintenance" and ctrl:
                 if k == Qt.Key_Up:
                     self._move_selected_item(-1)
                     return True
@@ -1426,7 +1804,7 @@ class StageProWindow(QMainWindow):
                     return True
 
             # Ctrl+F toggles maintenance <-> on-stage
-            if k == Qt.Key_F and (event.modifiers() & Qt.ControlModifier):
+            if k == Qt.Key_F and ctrl:
                 self._toggle_mode()
                 return True
 
@@ -1434,16 +1812,13 @@ class StageProWindow(QMainWindow):
             if self._maybe_handle_onstage_toggle_combo(k):
                 return True
 
-            self.pressed_keys.add(k)
+            self._pressed_mask |= _PEDAL_BITS.get(k, 0)
             self._start_or_stop_exit_timer()
 
             # navigation
-            if k in (Qt.Key_PageDown, Qt.Key_Right):
+            if k in _NEXT_KEYS:
                 if self._exit_combo_active():
                     return True
-                if (Qt.Key_Left in self.pressed_keys and Qt.Key_Right in self.pressed_keys) or \
-                   (Qt.Key_PageUp in self.pressed_keys and Qt.Key_PageDown in self.pressed_keys):
-                    return True
                 if self.mode == "onstage":
                     self.next_page()
                 else:
@@ -1451,12 +1826,9 @@ class StageProWindow(QMainWindow):
                     lst.setCurrentRow(min(lst.count() - 1, lst.currentRow() + 1))
                 return True
 
-            if k in (Qt.Key_PageUp, Qt.Key_Left):
+            if k in _PREV_KEYS:
                 if self._exit_combo_active():
                     return True
-                if (Qt.Key_Left in self.pressed_keys and Qt.Key_Right in self.pressed_keys) or \
-                   (Qt.Key_PageUp in self.pressed_keys and Qt.Key_PageDown in self.pressed_keys):
-                    return True
                 if self.mode == "onstage":
                     self.prev_page()
                 else:
@@ -1464,16 +1836,15 @@ class StageProWindow(QMainWindow):
                     lst.setCurrentRow(max(0, lst.currentRow() - 1))
                 return True
 
-        if event.type() == QEvent.KeyRelease and not event.isAutoRepeat():
-            k = event.key()
-            self.pressed_keys.discard(k)
+        if etype == QEvent.KeyRelease and not event.isAutoRepeat():
+            bit = _PEDAL_BITS.get(event.key(), 0)
+            self._pressed_mask &= ~bit
             self._start_or_stop_exit_timer()
 
-            # Unlatch combo when all relevant keys are released
-            if k in (Qt.Key_PageUp, Qt.Key_PageDown, Qt.Key_Left, Qt.Key_Right):
-                if not any(x in self.pressed_keys for x in (Qt.Key_PageUp, Qt.Key_PageDown, Qt.Key_Left, Qt.Key_Right)):
+            if bit:
+                # Unlatch combo when all relevant keys are released
+                if not self._pressed_mask:
                     self._combo_latched = False
-            if k in (Qt.Key_PageUp, Qt.Key_PageDown, Qt.Key_Left, Qt.Key_Right):
                 return True
 
         return super().eventFilter(obj, event)
@@ -1521,28 +1892,55 @@ class StageProWindow(QMainWindow):
 
     # ---------- Song loading / rendering ----------
 
+    def _screen_html(self, name: str, build) -> str:
+        """Fixed screens (welcome, blackout) only depend on theme colors, so
+        reuse the last HTML until the effective cfg changes."""
+        fingerprint = self._effective_cfg_fingerprint()
+        cached = self._screen_html_cache.get(name)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        html = build(self._effective_cfg().get("colors", {}) or {})
+        self._screen_html_cache[name] = (fingerprint, html)
+        return html
+
     def _welcome_html(self) -> str:
-        eff = self._effective_cfg()
-        colors = eff.get("colors", {}) or {}
-        bg = colors.get("background") or colors.get("bg") or "#000000"
-        fg = colors.get("text") or colors.get("lyrics") or "#FFFFFF"
-        return (
-            f"<html><body style='background:{bg};color:{fg};"
-            f"font-family:sans-serif;padding:24px;'>"
-            f"<h1>StagePro</h1><p>No songs found in your libraries</p>"
-            f"</body></html>"
-        )
+        def build(colors: dict) -> str:
+            bg = colors.get("background") or colors.get("bg") or "#000000"
+            fg = colors.get("text") or colors.get("lyrics") or "#FFFFFF"
+            return (
+                f"<html><body style='background:{bg};color:{fg};"
+                f"font-family:sans-serif;padding:24px;'>"
+                f"<h1>StagePro</h1><p>No songs found in your libraries</p>"
+                f"</body></html>"
+            )
+        return self._screen_html("welcome", build)
+
+    def _blackout_html(self) -> str:
+        def build(colors: dict) -> str:
+            bg = colors.get("background") or colors.get("bg") or "#000000"
+            return f"<html><body style='background:{bg};'></body></html>"
+        return self._screen_html("blackout", build)
 
 
+    def _library_lower_index(self, lib_paths: List[Path]) -> dict:
+        """Lowercased filename -> Path for a merged listing, in listing order.
+
+        merge_song_roots already dedupes by lowercased name, so this has one
+        entry per path. Built once per listing object.
+        """
+        cached = self._lib_lower_index
+        if cached is None or cached[0] is not lib_paths:
+            cached = self._lib_lower_index = (lib_paths, {p.name.lower(): p for p in lib_paths})
+        return cached[1]
+
     def _refresh_song_list(self) -> None:
         """Rebuild self.song_files from the ACTIVE playlist only (playlist == setlist)."""
         pl = self.playlists.get_active()
         items = list(pl.items or [])
 
-        # Map filenames -> actual Paths (skip missing)
-        existing = {
-            p.name.lower(): p for p in list_song_files_alpha_from_roots(self._song_roots(), self.cfg)
-        }
+        # Map filenames -> actual Paths (skip missing). Built once per library
+        # listing; playlist-only changes reuse it.
+        existing = self._library_lower_index(self._library_song_paths())
 
         ordered = []
         for name in items:
@@ -1550,7 +1948,23 @@ class StageProWindow(QMainWindow):
             if p:
                 ordered.append(p)
 
-        self.song_files = ordered
+        # Keep the same list object when nothing changed so _song_index_by_path stays valid.
+        if ordered != self.song_files:
+            self.song_files = ordered
+
+    def _song_index_by_path(self) -> dict:
+        """Resolved path -> first index in self.song_files, rebuilt when the list is replaced."""
+        cached = self._song_index_cache
+        if cached is None or cached[0] is not self.song_files:
+            index: dict = {}
+            for i, p in enumerate(self.song_files):
+                try:
+                    key = p.resolve()
+                except Exception:
+                    key = p
+                index.setdefault(key, i)
+            cached = self._song_index_cache = (self.song_files, index)
+        return cached[1]
 
     def _load_first_song_or_welcome(self):
         self._refresh_song_list()
@@ -1559,7 +1973,7 @@ class StageProWindow(QMainWindow):
             self.song = None
             self.pages = []
             self.page_index = 0
-            self.viewer.setHtml(self._welcome_html())
+            self._show_html(self._welcome_html())
             return
         self.load_song_by_index(0)
 
@@ -1569,21 +1983,18 @@ class StageProWindow(QMainWindow):
             self.song = None
             self.pages = []
             self.page_index = 0
-            self.viewer.setHtml(self._welcome_html())
+            self._show_html(self._welcome_html())
             return
 
         self.song_idx = max(0, min(idx, len(self.song_files) - 1))
         path = self.song_files[self.song_idx]
 
         try:
-            text = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            text = path.read_text(encoding="latin-1")
-
-        try:
-            self.song = parse_chordpro(text)
+            self._song_key, self.song = self._load_song_cached(path)
             self.blackout = False
             self.page_index = 0
+            self.pages = []  # the previous song's pages must not be paged through
+            self._pending_last_page = False
             self._repaginate_and_render()
         except Exception as e:
             QMessageBox.critical(self, "StagePro Error", f"Failed to open/parse:\n{path}\n\n{e}")
@@ -1594,34 +2005,175 @@ class StageProWindow(QMainWindow):
         h = max(200, int(self.viewer.height()))
         return w, h
 
+    def _schedule_repaginate(self) -> None:
+        self._repaginate_timer.start()
+
     def _repaginate_and_render(self):
+        self._repaginate_timer.stop()  # a direct call satisfies any pending request
         if not self.song:
             return
         w, h = self._available_doc_size()
         filename = self.song_files[self.song_idx].name if self.song_files else "Untitled"
-        chunks = song_to_chunks(self.song)
-        #cfg = self.effective_cfg()
-        eff_cfg = self._effective_cfg()
-        self.pages = paginate_to_fit(eff_cfg, self.song, filename, chunks, w, h)
+
+        key = self._pages_key(self._song_key, filename, w, h)
+        pages = self._pages_cache.get(key) if key is not None else None
+        if pages is not None:
+            self._pages_cache.move_to_end(key)
+        elif key is not None:
+            if key == self._pending_pages_key:
+                return  # already being paginated
+            # Paginate off the GUI thread; the viewer keeps showing what it has.
+            self._render_token += 1
+            self._pending_pages_key = key
+            if key in self._prefetching:
+                return  # _on_prefetch_ready installs it
+            self._render_pool.start(_PaginateTask(
+                self._paginate_signals, self._render_token, key,
+                self._effective_cfg(), self.song, filename, w, h,
+            ))
+            return
+        else:
+            pages = self._paginate_cached(None, self.song, filename, w, h)
+
+        self._render_token += 1  # anything still in flight is stale now
+        self._pending_pages_key = None
+        self._install_pages(pages, key)
+
+    def _install_pages(self, pages: List[str], key: Optional[tuple] = None) -> None:
+        self.pages = pages
+        self._shown_pages_key = key
+        if self.mode == "onstage":
+            self._prefetch_timer.start()
+        if self._pending_last_page:
+            self._pending_last_page = False
+            self.page_index = len(self.pages) - 1
         self.page_index = max(0, min(self.page_index, len(self.pages) - 1))
         self.render()
 
+    def _on_pages_ready(self, token: int, key: tuple, pages: Optional[List[str]], error: Optional[str]) -> None:
+        if token != self._render_token or not self.song:
+            return
+        self._pending_pages_key = None
+        if pages is None:
+            QMessageBox.critical(self, "StagePro Error", f"Failed to paginate:\n{key[1]}\n\n{error}")
+            return
+        self._remember_pages(key, pages)
+        self._install_pages(pages, key)
+
+    def _prefetch_adjacent_songs(self) -> None:
+        """Paginate the songs before and after the current one on the thread pool."""
+        if self.mode != "onstage" or not self.song or not self.song_files:
+            return
+        w, h = self._available_doc_size()
+        eff_cfg = self._effective_cfg()
+        for idx in (self.song_idx + 1, self.song_idx - 1):
+            if not 0 <= idx < len(self.song_files):
+                continue
+            path = self.song_files[idx]
+            try:
+                song_key, song = self._load_song_cached(path)
+            except Exception:
+                continue  # reported if the user actually navigates there
+            key = self._pages_key(song_key, path.name, w, h)
+            if key in self._pages_cache or key in self._prefetching or key == self._pending_pages_key:
+                continue
+            self._prefetching.add(key)
+            # Lower priority than on-demand pagination queued after it.
+            self._render_pool.start(_PaginateTask(
+                self._prefetch_signals, 0, key, eff_cfg, song, path.name, w, h,
+            ), -1)
+
+    def _on_prefetch_ready(self, _token: int, key: tuple, pages: Optional[List[str]], error: Optional[str]) -> None:
+        self._prefetching.discard(key)
+        if key == self._pending_pages_key:
+            # The user got there first and is waiting on this result.
+            self._on_pages_ready(self._render_token, key, pages, error)
+        elif pages is not None:
+            self._remember_pages(key, pages)
+
+    def _load_song_cached(self, path: Path) -> Tuple[str, Song]:
+        """Return (content digest, parsed Song), parsing only when the content changed."""
+        st = path.stat()
+        stat_key = (str(path), st.st_mtime_ns, st.st_size)
+        digest = self._digest_by_stat.get(stat_key)
+        if digest is not None:
+            song = self._song_cache.get(digest)
+            if song is not None:
+                self._digest_by_stat.move_to_end(stat_key)
+                self._song_cache.move_to_end(digest)
+                return digest, song
+
+        data = path.read_bytes()
+        digest = hashlib.sha1(data).hexdigest()
+        self._digest_by_stat[stat_key] = digest
+        if len(self._digest_by_stat) > _SONG_CACHE_SIZE:
+            self._digest_by_stat.popitem(last=False)
+
+        song = self._song_cache.get(digest)
+        if song is None:
+            song = parse_chordpro(decode_song_bytes(data))
+            self._song_cache[digest] = song
+            if len(self._song_cache) > _SONG_CACHE_SIZE:
+                self._song_cache.popitem(last=False)
+        else:
+            self._song_cache.move_to_end(digest)
+        return digest, song
+
+    def _paginate_cached(self, song_key: Optional[str], song: Song, filename: str, w: int, h: int) -> List[str]:
+        eff_cfg = self._effective_cfg()
+        if song_key is None:
+            return paginate_to_fit(eff_cfg, song, filename, song_to_chunks(song), w, h)
+
+        key = self._pages_key(song_key, filename, w, h)
+        pages = self._pages_cache.get(key)
+        if pages is not None:
+            self._pages_cache.move_to_end(key)
+            return pages
+
+        pages = paginate_to_fit(eff_cfg, song, filename, song_to_chunks(song), w, h)
+        self._remember_pages(key, pages)
+        return pages
+
+    def _layout_is_current(self) -> bool:
+        """True when the shown pages were built for the current song, cfg and size."""
+        if not self.song or not self.pages or self._shown_pages_key is None:
+            return False
+        w, h = self._available_doc_size()
+        filename = self.song_files[self.song_idx].name if self.song_files else "Untitled"
+        return self._pages_key(self._song_key, filename, w, h) == self._shown_pages_key
+
+    def _pages_key(self, song_key: Optional[str], filename: str, w: int, h: int) -> Optional[tuple]:
+        if song_key is None:
+            return None
+        return (song_key, filename, self._effective_cfg_fingerprint(), w, h)
+
+    def _remember_pages(self, key: tuple, pages: List[str]) -> None:
+        self._pages_cache[key] = pages
+        self._pages_cache.move_to_end(key)
+        if len(self._pages_cache) > _SONG_CACHE_SIZE:
+            self._pages_cache.popitem(last=False)
+
+    def _show_html(self, html: str) -> None:
+        """setHtml on the on-stage viewer, skipped when that exact page is already shown."""
+        if html == self._viewer_html:
+            return
+        self._viewer_html = html
+        self.viewer.setHtml(html)
+
     def render(self):
         if self.blackout:
-            eff = self._effective_cfg()
-            colors = eff.get("colors", {}) or {}
-            bg = colors.get("background") or colors.get("bg") or "#000000"
-            self.viewer.setHtml(f"<html><body style='background:{bg};'></body></html>")
+            self._show_html(self._blackout_html())
             return
         if not self.song:
-            self.viewer.setHtml(self._welcome_html())
+            self._show_html(self._welcome_html())
             return
         if not self.pages:
             self._repaginate_and_render()
             if not self.pages:
-                self.viewer.setHtml(self._welcome_html())
+                if self._pending_pages_key is None:
+                    self._show_html(self._welcome_html())
                 return
-        self.viewer.setHtml(self.pages[self.page_index])
+        self._show_html(self.pages[self.page_index])
 
     # ---------- Controls ----------
 
@@ -1656,21 +2208,40 @@ class StageProWindow(QMainWindow):
             return
         if self.song_idx > 0:
             self.load_song_by_index(self.song_idx - 1)
-            if go_to_last_page and self.pages:
+            if go_to_last_page and self._pending_pages_key is not None:
+                # Pages are still being built; jump once they arrive.
+                self._pending_last_page = True
+            elif go_to_last_page and self.pages:
                 self.page_index = max(0, len(self.pages) - 1)
                 self.render()
         else:
             self.render()
 
     def reload_config(self):
+        """Reload the config file once the current burst of requests settles."""
+        self._reload_timer.start()
+
+    def _reload_config_now(self):
         try:
-            if self.config_path.exists():
-                import json
-                from .config import merge_defaults, default_config
-                cfg = json.loads(self.config_path.read_text(encoding="utf-8"))
+            stamp = self._config_file_stamp()
+            # Unchanged file: self.cfg already holds what it would parse to.
+            if stamp is not None and stamp != self._cfg_stamp:
+                cfg = parse_config_bytes(self.config_path.read_bytes())
                 self.cfg = merge_defaults(default_config(), cfg)
-            self.exit_hold_ms = int((self.cfg.get("shortcuts", {}) or {}).get("exit_hold_ms", 1500))
+                self._cfg_stamp = stamp
+            self._reload_error_shown.discard(self.config_path)
+            self._apply_cfg_settings()
+            # The pages key covers the effective cfg (theme included), so an
+            # unchanged key means orientation and layout are already right.
+            if self._layout_is_current():
+                return
             self._apply_orientation_transform()
             self._repaginate_and_render()
         except Exception as e:
+            # Only the first failure for a file gets the modal dialog; repeats
+            # (e.g. every save while the JSON is half-edited) just update the status line.
+            if self.config_path in self._reload_error_shown:
+                self.maint_status.setText(f"Failed to reload config: {e}")
+                return
+            self._reload_error_shown.add(self.config_path)
             QMessageBox.critical(self, "StagePro Error", f"Failed to reload config:\n{e}")
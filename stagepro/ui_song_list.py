@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel, Signal
+from PySide6.QtWidgets import QAbstractItemView, QListView, QWidget
+
+# (display name, absolute path, enabled)
+SongRow = Tuple[str, str, bool]
+
+
+class SongListModel(QAbstractListModel):
+    """Flat list of songs for the maintenance Playlist/Library views.
+
+    Rows are plain tuples, so refreshing thousands of songs is one model reset
+    instead of one QListWidgetItem per song.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._rows: List[SongRow] = []
+        # path -> row, built on first lookup after the rows change
+        self._row_by_path: Optional[Dict[str, int]] = None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        name, path, _ = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.UserRole:
+            return path
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if self._rows[index.row()][2]:
+            return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        return Qt.ItemIsSelectable
+
+    def set_rows(self, rows: Iterable[SongRow]) -> bool:
+        """Replace all rows; returns False when nothing changed.
+
+        Only the changed middle part (between the common prefix and suffix)
+        is updated, so adding, removing or enabling one song touches one row
+        instead of resetting the whole list. Large changes still reset.
+        """
+        rows = list(rows)
+        old = self._rows
+        if rows == old:
+            return False
+
+        start = 0
+        limit = min(len(old), len(rows))
+        while start < limit and old[start] == rows[start]:
+            start += 1
+        end_old, end_new = len(old), len(rows)
+        while end_old > start and end_new > start and old[end_old - 1] == rows[end_new - 1]:
+            end_old -= 1
+            end_new -= 1
+        removed = end_old - start
+        inserted = end_new - start
+
+        self._row_by_path = None
+        if max(removed, inserted) * 2 > max(len(old), len(rows)):
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+        elif removed == inserted:
+            self._rows = rows
+            self.dataChanged.emit(self.index(start, 0), self.index(end_new - 1, 0))
+        else:
+            if removed:
+                self.beginRemoveRows(QModelIndex(), start, end_old - 1)
+                del self._rows[start:end_old]
+                self.endRemoveRows()
+            if inserted:
+                self.beginInsertRows(QModelIndex(), start, end_new - 1)
+                self._rows[start:start] = rows[start:end_new]
+                self.endInsertRows()
+        return True
+
+    def row_of_path(self, path: str) -> int:
+        if self._row_by_path is None:
+            index: Dict[str, int] = {}
+            for row, (_, row_path, _) in enumerate(self._rows):
+                index.setdefault(row_path, row)
+            self._row_by_path = index
+        return self._row_by_path.get(path, -1)
+
+    def moveRows(
+        self,
+        source_parent: QModelIndex,
+        source_row: int,
+        count: int,
+        dest_parent: QModelIndex,
+        dest_child: int,
+    ) -> bool:
+        if source_parent.isValid() or dest_parent.isValid() or count <= 0:
+            return False
+        if source_row < 0 or source_row + count > len(self._rows):
+            return False
+        if not 0 <= dest_child <= len(self._rows):
+            return False
+        if source_row <= dest_child <= source_row + count:
+            return False  # no-op move
+        if not self.beginMoveRows(source_parent, source_row, source_row + count - 1, dest_parent, dest_child):
+            return False
+        moved = self._rows[source_row:source_row + count]
+        del self._rows[source_row:source_row + count]
+        insert_at = dest_child - count if dest_child > source_row else dest_child
+        self._rows[insert_at:insert_at] = moved
+        self._row_by_path = None
+        self.endMoveRows()
+        return True
+
+
+class SongFilterModel(QSortFilterProxyModel):
+    """Case-insensitive substring filter over a SongListModel's display names.
+
+    The matching runs in Qt, so narrowing a large library per keystroke never
+    touches the Python rows.
+    """
+
+    def __init__(self, source: SongListModel, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setSourceModel(source)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setFilterKeyColumn(0)
+
+
+class SongListView(QListView):
+    """QListView over a SongListModel with the few QListWidget-style helpers ui_main uses."""
+
+    itemSelectionChanged = Signal()
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Every row is one line of text: let the view measure a single row
+        # instead of asking for a size hint per song, and elide long names
+        # while painting.
+        self.setUniformItemSizes(True)
+        self.setTextElideMode(Qt.ElideRight)
+        self.setModel(SongListModel(self))
+
+    def setModel(self, model) -> None:
+        # QAbstractItemView.setModel replaces the selection model but leaves the
+        # old one to the caller; release it so swaps don't leak it (and its connection).
+        old_selection = self.selectionModel()
+        super().setModel(model)
+        if old_selection is not None and old_selection is not self.selectionModel():
+            old_selection.selectionChanged.disconnect(self._on_selection_changed)
+            old_selection.deleteLater()
+        # Re-emit the view's QListWidget-style signal from one bound slot.
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
+
+    def _on_selection_changed(self, *_args) -> None:
+        self.itemSelectionChanged.emit()
+
+    def song_model(self) -> SongListModel:
+        model = self.model()
+        if isinstance(model, QSortFilterProxyModel):
+            return model.sourceModel()
+        return model
+
+    def set_rows(self, rows: Iterable[SongRow]) -> None:
+        # Clear first so listeners hear about the lost selection (a model reset drops it silently).
+        if self.selectionModel().hasSelection():
+            self.selectionModel().clear()
+        self.song_model().set_rows(rows)
+
+    def count(self) -> int:
+        return self.model().rowCount()
+
+    def currentRow(self) -> int:
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row: int) -> None:
+        self.setCurrentIndex(self.model().index(row, 0))
+
+    def path_at(self, row: int) -> Optional[str]:
+        return self.model().index(row, 0).data(Qt.UserRole)
+
+    def paths(self) -> List[str]:
+        return [self.path_at(row) for row in range(self.count())]
+
+    def row_of_path(self, path: str) -> int:
+        row = self.song_model().row_of_path(path)
+        model = self.model()
+        if row >= 0 and isinstance(model, QSortFilterProxyModel):
+            # -1 when the row is currently filtered out
+            row = model.mapFromSource(self.song_model().index(row, 0)).row()
+        return row
+
+    def selected_path(self) -> Optional[str]:
+        indexes = self.selectionModel().selectedIndexes()
+        return indexes[0].data(Qt.UserRole) if indexes else None
+
+    def current_path(self) -> Optional[str]:
+        index = self.currentIndex()
+        return index.data(Qt.UserRole) if index.isValid() else None
+
+    def move_row(self, row: int, new_row: int) -> bool:
+        """Move one row so it ends up at new_row (view rows; mapped through a filter if set)."""
+        model = self.model()
+        if isinstance(model, QSortFilterProxyModel):
+            row = model.mapToSource(model.index(row, 0)).row()
+            new_row = model.mapToSource(model.index(new_row, 0)).row()
+            if row < 0 or new_row < 0:
+                return False
+        dest = new_row + 1 if new_row > row else new_row
+        return self.song_model().moveRow(QModelIndex(), row, QModelIndex(), dest)